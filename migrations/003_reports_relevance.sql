@@ -0,0 +1,19 @@
+-- =============================================================================
+-- Migration 003: Deep research linkage and relevance indexes on reports
+-- =============================================================================
+-- Database.get_high_relevance_reports() filters on data->relevance_score and
+-- deep_research_id server-side. These indexes keep that query off a full
+-- table scan as the reports table grows.
+
+-- Columns written by Database.save_deep_research_report()
+ALTER TABLE reports ADD COLUMN IF NOT EXISTS deep_research_id TEXT;
+ALTER TABLE reports ADD COLUMN IF NOT EXISTS original_report_id TEXT;
+
+-- Matches the PostgREST filter `data->relevance_score=gte.<n>` (jsonb compare)
+CREATE INDEX IF NOT EXISTS idx_reports_relevance
+    ON reports ((data->'relevance_score'));
+
+-- Scout reports still waiting for deep research, newest first
+CREATE INDEX IF NOT EXISTS idx_reports_scout_pending_research
+    ON reports (created_at DESC)
+    WHERE type = 'scout' AND deep_research_id IS NULL;
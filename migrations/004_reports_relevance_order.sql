@@ -0,0 +1,11 @@
+-- =============================================================================
+-- Migration 004: Relevance-ordered index for pending deep research
+-- =============================================================================
+-- Database.get_high_relevance_reports() returns the most relevant scout
+-- reports first (ORDER BY data->'relevance_score' DESC NULLS LAST,
+-- created_at DESC) with a small LIMIT. This index matches that ordering so
+-- Postgres reads only the top k entries instead of sorting every candidate.
+
+CREATE INDEX IF NOT EXISTS idx_reports_scout_pending_relevance
+    ON reports ((data->'relevance_score') DESC NULLS LAST, created_at DESC)
+    WHERE type = 'scout' AND deep_research_id IS NULL;
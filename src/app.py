@@ -490,22 +490,45 @@ async def list_registered_agents():
 # ROUTES: SSE Streaming
 # =============================================================================
 
+_TERMINAL_RUN_STATUSES = ("completed", "failed")
+
+
 async def event_generator(run_id: str):
-    """Generate SSE events for a run."""
+    """
+    Generate SSE events for a run.
+
+    The current status is emitted immediately on subscription, so clients
+    reconnecting to an already-finished run get their single event without
+    entering the poll loop.
+    """
     import asyncio
 
+    data = state.get_run(run_id)
+    if data is None:
+        return
+
+    yield {
+        "event": "status",
+        "data": json.dumps(data, default=str)
+    }
+    if data.get("status") in _TERMINAL_RUN_STATUSES:
+        return
+
     while True:
+        await asyncio.sleep(1)
+
         data = state.get_run(run_id)
-        if data is not None:
-            yield {
-                "event": "status",
-                "data": json.dumps(data, default=str)
-            }
+        if data is None:
+            # Run expired or was removed while streaming
+            return
 
-            if data.get("status") in ["completed", "failed"]:
-                break
+        yield {
+            "event": "status",
+            "data": json.dumps(data, default=str)
+        }
 
-        await asyncio.sleep(1)
+        if data.get("status") in _TERMINAL_RUN_STATUSES:
+            return
 
 
 @app.get("/stream/{run_id}")
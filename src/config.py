@@ -20,13 +20,15 @@ Environment Variables:
 
 import copy
 import os
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Optional
 from functools import lru_cache
+from itertools import chain
 
 import yaml
 from dotenv import load_dotenv
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 # Load env vars from .env file
 load_dotenv()
@@ -130,8 +132,12 @@ def load_entities_config() -> dict[str, Any]:
 # =============================================================================
 # PYDANTIC MODELS FOR CONFIGURATION
 # =============================================================================
+# Small leaf configs are slotted, frozen dataclasses: pydantic still validates
+# them when they appear as fields of the models below, but each instance is
+# a plain slotted object with no per-instance __dict__ or model machinery.
 
-class InstanceOperator(BaseModel):
+@dataclass(slots=True, frozen=True)
+class InstanceOperator:
     """Operator/maintainer of this instance."""
     name: str
     email: Optional[str] = None
@@ -147,7 +153,8 @@ class InstanceIdentity(BaseModel):
     operator: Optional[InstanceOperator] = None
 
 
-class Municipality(BaseModel):
+@dataclass(slots=True, frozen=True)
+class Municipality:
     """A municipality within the jurisdiction."""
     name: str
     type: str = "city"
@@ -166,10 +173,11 @@ class Jurisdiction(BaseModel):
     include_unincorporated: bool = True
 
 
-class ScheduleConfig(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class ScheduleConfig:
     """Schedule configuration for an agent type."""
     enabled: bool = True
-    cron: str = Field(description="Cron expression for scheduling")
+    cron: str  # Cron expression for scheduling
     retry_on_failure: bool = True
     max_retries: int = 3
     requires_approval: bool = False
@@ -182,18 +190,20 @@ class Schedule(BaseModel):
     synthesizers: ScheduleConfig = ScheduleConfig(cron="0 10 1 * *", requires_approval=True)
 
 
-class ScrapingConfig(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ScrapingConfig:
     """Scraping configuration for a source."""
-    method: str = Field(description="playwright, beautifulsoup, firecrawl, api")
+    method: str  # playwright, beautifulsoup, firecrawl, api
     requires_javascript: bool = False
     wait_for_selector: Optional[str] = None
     intercept_api: bool = False
 
 
-class BoardConfig(BaseModel):
+@dataclass(slots=True, frozen=True)
+class BoardConfig:
     """Configuration for a board/committee to monitor."""
     name: str
-    keywords: list[str] = []
+    keywords: list[str] = field(default_factory=list)
     priority: str = "medium"
 
 
@@ -242,6 +252,27 @@ class OrganizationEntity(BaseModel):
     notes: Optional[str] = None
 
 
+# Cached TypeAdapters let pydantic-core validate a whole YAML list in one call
+# instead of rebuilding each model (and its nested models) row by row.
+
+@lru_cache(maxsize=None)
+def _sources_adapter() -> TypeAdapter[list[SourceConfig]]:
+    """TypeAdapter for bulk SourceConfig validation (cached, internal)."""
+    return TypeAdapter(list[SourceConfig])
+
+
+@lru_cache(maxsize=None)
+def _projects_adapter() -> TypeAdapter[list[ProjectEntity]]:
+    """TypeAdapter for bulk ProjectEntity validation (cached, internal)."""
+    return TypeAdapter(list[ProjectEntity])
+
+
+@lru_cache(maxsize=None)
+def _organizations_adapter() -> TypeAdapter[list[OrganizationEntity]]:
+    """TypeAdapter for bulk OrganizationEntity validation (cached, internal)."""
+    return TypeAdapter(list[OrganizationEntity])
+
+
 # =============================================================================
 # UNIFIED CONFIGURATION CLASS
 # =============================================================================
@@ -278,7 +309,9 @@ def build_app_config() -> AppConfig:
     Loads all YAML files, validates with Pydantic, and combines with API keys.
     """
     api_keys = load_api_keys()
-    instance_data = load_instance_config()
+    # Pydantic builds its own containers from these kwargs, so the cached
+    # dict is never retained or mutated and needs no defensive copy.
+    instance_data = _load_instance_config()
 
     return AppConfig(
         api_keys=api_keys,
@@ -288,40 +321,44 @@ def build_app_config() -> AppConfig:
     )
 
 
+# Tier number -> sources.yaml key (updated to match sources.yaml structure)
+SOURCE_TIER_KEYS: dict[int, str] = {
+    1: "tier_1_municipal",     # City level
+    2: "tier_2_county",        # County level
+    3: "tier_3_regional",      # Water management districts
+    4: "tier_4_legal",         # Legal notices & public records
+    5: "tier_5_civic",         # News & civic organizations
+    6: "tier_6_state",         # Florida state government
+    7: "tier_7_federal",       # US federal government
+}
+
+
+@lru_cache(maxsize=1)
+def _load_all_sources_cached() -> tuple[tuple[SourceConfig, ...], dict[int, tuple[SourceConfig, ...]]]:
+    """
+    Parse sources.yaml into SourceConfig objects once (cached, internal).
+
+    Returns:
+        (all sources in tier order, sources keyed by tier number)
+    """
+    sources_data = _load_sources_config()
+    adapter = _sources_adapter()
+    by_tier = {
+        tier: tuple(adapter.validate_python(sources_data.get(tier_key) or []))
+        for tier, tier_key in SOURCE_TIER_KEYS.items()
+    }
+    all_sources = tuple(source for tier_sources in by_tier.values() for source in tier_sources)
+    return all_sources, by_tier
+
+
 def get_all_sources() -> list[SourceConfig]:
     """
     Get all configured sources across all tiers.
 
-    Returns a flat list of SourceConfig objects.
+    Returns a flat list of SourceConfig objects. The list is fresh but the
+    SourceConfig objects are shared from the cache - treat them as read-only.
     """
-    sources_data = load_sources_config()
-    all_sources = []
-
-    # Iterate through all tier keys (updated to match sources.yaml structure)
-    tier_keys = [
-        "tier_1_municipal",     # City level
-        "tier_2_county",        # County level
-        "tier_3_regional",      # Water management districts
-        "tier_4_legal",         # Legal notices & public records
-        "tier_5_civic",         # News & civic organizations
-        "tier_6_state",         # Florida state government
-        "tier_7_federal",       # US federal government
-    ]
-
-    for tier_key in tier_keys:
-        tier_sources = sources_data.get(tier_key, [])
-        for source in tier_sources:
-            # Make a copy to avoid mutating cached data
-            source_copy = source.copy()
-            # Parse scraping config
-            if "scraping" in source_copy:
-                source_copy["scraping"] = ScrapingConfig(**source_copy["scraping"])
-            # Parse board configs
-            if "boards" in source_copy:
-                source_copy["boards"] = [BoardConfig(**b) for b in source_copy["boards"]]
-            all_sources.append(SourceConfig(**source_copy))
-
-    return all_sources
+    return list(_load_all_sources_cached()[0])
 
 
 def get_sources_by_tier(tier: int) -> list[SourceConfig]:
@@ -331,73 +368,65 @@ def get_sources_by_tier(tier: int) -> list[SourceConfig]:
     Tier 1: Municipal, Tier 2: County, Tier 3: Regional,
     Tier 4: Legal, Tier 5: Civic, Tier 6: State, Tier 7: Federal
     """
-    tier_map = {
-        1: "tier_1_municipal",
-        2: "tier_2_county",
-        3: "tier_3_regional",
-        4: "tier_4_legal",
-        5: "tier_5_civic",
-        6: "tier_6_state",
-        7: "tier_7_federal",
-    }
-    tier_key = tier_map.get(tier)
-    if not tier_key:
-        return []
-
-    sources_data = load_sources_config()
-    tier_sources = sources_data.get(tier_key, [])
-    result = []
-    for source in tier_sources:
-        source_copy = source.copy()
-        if "scraping" in source_copy:
-            source_copy["scraping"] = ScrapingConfig(**source_copy["scraping"])
-        if "boards" in source_copy:
-            source_copy["boards"] = [BoardConfig(**b) for b in source_copy["boards"]]
-        result.append(SourceConfig(**source_copy))
-    return result
+    return list(_load_all_sources_cached()[1].get(tier, ()))
 
 
 def get_sources_by_priority(priority: str) -> list[SourceConfig]:
     """Get sources filtered by priority level."""
-    return [s for s in get_all_sources() if s.priority == priority]
+    return [s for s in _load_all_sources_cached()[0] if s.priority == priority]
 
 
-def get_projects() -> list[ProjectEntity]:
-    """Get all project entities from the watchlist."""
-    entities_data = load_entities_config()
-    return [ProjectEntity(**p) for p in entities_data.get("projects", [])]
+@lru_cache(maxsize=1)
+def _cached_entities() -> tuple[tuple[ProjectEntity, ...], tuple[OrganizationEntity, ...]]:
+    """Parse entities.yaml into watchlist models once (cached, internal)."""
+    entities_data = _load_entities_config()
+    projects = _projects_adapter().validate_python(entities_data.get("projects") or [])
+    organizations = _organizations_adapter().validate_python(
+        entities_data.get("organizations") or []
+    )
+    return tuple(projects), tuple(organizations)
 
 
-def get_organizations() -> list[OrganizationEntity]:
-    """Get all organization entities from the watchlist."""
-    entities_data = load_entities_config()
-    return [OrganizationEntity(**o) for o in entities_data.get("organizations", [])]
+def get_projects() -> list[ProjectEntity]:
+    """
+    Get all project entities from the watchlist.
+
+    The entities are shared from the cache - treat them as read-only.
+    """
+    return list(_cached_entities()[0])
 
 
-def get_all_keywords() -> set[str]:
+def get_organizations() -> list[OrganizationEntity]:
     """
-    Get all keywords from projects and organizations for matching.
+    Get all organization entities from the watchlist.
 
-    Returns a deduplicated set of all keywords and aliases.
+    The entities are shared from the cache - treat them as read-only.
     """
-    keywords = set()
+    return list(_cached_entities()[1])
 
-    for project in get_projects():
-        keywords.update(project.keywords)
-        keywords.update(project.aliases)
 
-    for org in get_organizations():
-        keywords.update(org.keywords)
-        keywords.update(org.aliases)
+@lru_cache(maxsize=1)
+def get_all_keywords() -> frozenset[str]:
+    """
+    Get all keywords from projects and organizations for matching.
 
-    return keywords
+    Returns a deduplicated, immutable set of all keywords and aliases.
+    Cached until clear_config_cache() is called.
+    """
+    return frozenset(chain.from_iterable(
+        (*entity.keywords, *entity.aliases)
+        for entity in chain.from_iterable(_cached_entities())
+    ))
 
 
 def clear_config_cache() -> None:
     """Clear cached configuration (useful for testing or hot-reload)."""
-    load_instance_config.cache_clear()
-    load_sources_config.cache_clear()
-    load_entities_config.cache_clear()
+    _load_instance_config.cache_clear()
+    _load_sources_config.cache_clear()
+    _load_entities_config.cache_clear()
+    _load_all_sources_cached.cache_clear()
+    _cached_entities.cache_clear()
+    get_all_keywords.cache_clear()
 
 
 # =============================================================================
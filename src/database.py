@@ -1,32 +1,174 @@
-import json
+import asyncio
 import hashlib
-from datetime import datetime
-from typing import Optional, List
-from supabase import create_client, Client
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Hashable, Optional, List, Set, Tuple, Union
 from src.config import SUPABASE_URL, SUPABASE_KEY
-from src.schemas import ScoutReport, AnalystReport
 from src.logging_config import get_logger
 
+if TYPE_CHECKING:
+    # supabase-py pulls in httpx, gotrue, postgrest and realtime; it is
+    # imported when a Database is actually built, not on module import.
+    from supabase import AsyncClient, Client
+    from src.schemas import ScoutReport, AnalystReport
+
 logger = get_logger("database")
 
+# Max rows per bulk upsert request (keeps payloads under PostgREST limits)
+UPSERT_BATCH_SIZE = 500
+
+# Max ids per `in.(...)` filter (keeps GET query strings under URL limits)
+IN_FILTER_BATCH_SIZE = 200
+
+# Characters encoded per slice when hashing large text content
+HASH_CHUNK_CHARS = 65536
+
+# Default column projections. scraped_meetings.pdf_content can be megabytes
+# of extracted text, so reads skip it unless a caller asks for columns="*".
+MEETING_SUMMARY_COLUMNS = (
+    "meeting_id,source_id,title,meeting_date,board,agenda_posted_date,"
+    "agenda_packet_url,has_agenda,has_agenda_packet,content_hash,"
+    "last_scraped_at,last_analyzed_at,report_id,metadata"
+)
+REPORT_COLUMNS = "id,type,created_at,data,deep_research_id"
+
+# Max in-flight requests for the async batch helpers
+ASYNC_CONCURRENCY = 32
+
+# Shared HTTP connection pool for the Supabase clients. Keep-alive
+# connections are reused across requests and threads, so only the first
+# request on each connection pays for the TLS handshake.
+HTTP_MAX_CONNECTIONS = 100
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 50
+HTTP_TIMEOUT_SECONDS = 120.0  # supabase-py's default PostgREST timeout
+
+# Read cache for get_meeting/get_document (entries per table, seconds)
+READ_CACHE_SIZE = 4096
+READ_CACHE_TTL_SECONDS = 30.0
+
+_MISSING = object()
+
+
+class _TTLCache:
+    """Thread-safe LRU cache whose entries expire after a fixed TTL."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any:
+        """Return the cached value, or _MISSING if absent or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return _MISSING
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return _MISSING
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Cache a value, evicting the least recently used entry if full."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def discard(self, key: Hashable) -> None:
+        """Drop a key if present."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
+
+
+def _http_limits():
+    """Connection-pool limits shared by the sync and async Supabase clients."""
+    import httpx
+
+    return httpx.Limits(
+        max_connections=HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    )
+
+
+def _now_iso() -> str:
+    """Current time as a timezone-aware UTC ISO string (for TIMESTAMPTZ columns)."""
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _normalize_meeting_dates(meeting_data: dict) -> None:
+    """Convert datetime fields of a meeting row to ISO strings in place."""
+    if isinstance(meeting_data.get('meeting_date'), datetime):
+        meeting_data['meeting_date'] = meeting_data['meeting_date'].isoformat()
+    if isinstance(meeting_data.get('agenda_posted_date'), datetime):
+        meeting_data['agenda_posted_date'] = meeting_data['agenda_posted_date'].isoformat()
+
+
+def _normalize_meeting_rows(meetings: List[dict], scraped_at: str) -> None:
+    """Normalize dates and stamp last_scraped_at on a batch of rows in one pass."""
+    for meeting_data in meetings:
+        _normalize_meeting_dates(meeting_data)
+        meeting_data['last_scraped_at'] = scraped_at
+
 
 class Database:
+    """
+    Supabase (PostgREST) access for reports, scraped meetings and documents.
+
+    Payload serialization: write payloads are built as plain JSON-compatible
+    dicts (model_dump(mode="json")), and postgrest-py decodes responses with
+    pydantic-core's Rust JSON parser, so no extra JSON codec is layered on top.
+    """
+
     def __init__(self):
         if not SUPABASE_URL or not SUPABASE_KEY:
             raise ValueError("SUPABASE_URL and SUPABASE_KEY must be set in .env")
-        self.supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
-
-    def save_report(self, report: ScoutReport):
+        import httpx
+        from supabase import ClientOptions, create_client
+
+        self._http_client = httpx.Client(limits=_http_limits(), timeout=HTTP_TIMEOUT_SECONDS)
+        self.supabase: "Client" = create_client(
+            SUPABASE_URL, SUPABASE_KEY, options=ClientOptions(httpx_client=self._http_client)
+        )
+        # Created on first use of an async method (see _get_async_client)
+        self._async_supabase: Optional["AsyncClient"] = None
+
+        # Short-lived read caches. Scrapers look up the same rows repeatedly
+        # within one pass; writes through this instance invalidate entries.
+        self._meeting_cache = _TTLCache(READ_CACHE_SIZE, READ_CACHE_TTL_SECONDS)
+        self._document_cache = _TTLCache(READ_CACHE_SIZE, READ_CACHE_TTL_SECONDS)
+
+    def flush_caches(self) -> None:
+        """Drop all cached meeting/document reads (e.g. between pipeline stages)."""
+        self._meeting_cache.clear()
+        self._document_cache.clear()
+
+    def _invalidate_meeting(self, meeting_data: dict) -> None:
+        """Drop the cached row for a meeting that is being written."""
+        self._meeting_cache.discard((meeting_data.get('meeting_id'), meeting_data.get('source_id')))
+
+    def save_report(self, report: "ScoutReport"):
         """Saves a ScoutReport to the 'reports' table."""
         try:
-            # We dump the Pydantic model to JSON
+            # Dump the Pydantic model straight to JSON-compatible Python types
             # Note: You need to create a 'reports' table in Supabase with a 'data' jsonb column
-            data = json.loads(report.model_dump_json())
+            data = report.model_dump(mode="json")
 
             payload = {
                 "id": report.report_id, # Assuming uuid or string primary key
                 "type": "scout",
-                "created_at": datetime.now().isoformat(),
+                "created_at": _now_iso(),
                 "data": data
             }
 
@@ -37,33 +179,128 @@ class Database:
             logger.error("Error saving report to Supabase", error=str(e))
             raise e
 
+    def save_reports(self, reports: List["ScoutReport"], batch_size: int = UPSERT_BATCH_SIZE) -> int:
+        """
+        Save many ScoutReports to the 'reports' table in batched round-trips.
+
+        Args:
+            reports: Reports to save
+            batch_size: Rows per upsert request
+
+        Returns:
+            Number of reports written
+        """
+        created_at = _now_iso()
+        payloads = [
+            {
+                "id": report.report_id,
+                "type": "scout",
+                "created_at": created_at,
+                "data": report.model_dump(mode="json")
+            }
+            for report in reports
+        ]
+
+        try:
+            for start in range(0, len(payloads), batch_size):
+                batch = payloads[start:start + batch_size]
+                self.supabase.table("reports").upsert(batch).execute()
+            return len(payloads)
+        except Exception as e:
+            logger.error("Error saving reports to Supabase", count=len(payloads), error=str(e))
+            raise e
+
     # =========================================================================
     # Meeting State Tracking (for Hybrid Scraping Pipeline)
     # =========================================================================
 
-    def get_meeting(self, meeting_id: str, source_id: str) -> Optional[dict]:
-        """Get a meeting by ID and source."""
+    def get_meeting(
+        self,
+        meeting_id: str,
+        source_id: str,
+        columns: str = MEETING_SUMMARY_COLUMNS
+    ) -> Optional[dict]:
+        """
+        Get a meeting by ID and source (without pdf_content unless columns="*").
+
+        Default-projection reads are served from a short TTL cache; treat the
+        returned dict as read-only.
+        """
+        use_cache = columns == MEETING_SUMMARY_COLUMNS
+        if use_cache:
+            cached = self._meeting_cache.get((meeting_id, source_id))
+            if cached is not _MISSING:
+                return cached
+
         try:
-            response = self.supabase.table("scraped_meetings").select("*").eq(
+            response = self.supabase.table("scraped_meetings").select(columns).eq(
                 "meeting_id", meeting_id
             ).eq("source_id", source_id).execute()
-
-            if response.data and len(response.data) > 0:
-                return response.data[0]
-            return None
         except Exception as e:
             logger.error("Error fetching meeting", meeting_id=meeting_id, error=str(e))
             return None
 
+        row = response.data[0] if response.data else None
+        if use_cache:
+            self._meeting_cache.set((meeting_id, source_id), row)
+        return row
+
+    def get_meetings_bulk(
+        self,
+        source_id: str,
+        meeting_ids: List[str],
+        columns: str = MEETING_SUMMARY_COLUMNS
+    ) -> dict[str, dict]:
+        """
+        Get many meetings of one source, keyed by meeting_id.
+
+        The bulk counterpart of get_meeting(): cached rows are reused and the
+        rest are fetched with one in.() SELECT per IN_FILTER_BATCH_SIZE ids.
+        Meetings with no row are absent from the result, as are meetings in
+        a batch that failed to load (logged), matching get_meeting()'s None.
+        A custom `columns` projection must include meeting_id.
+        """
+        use_cache = columns == MEETING_SUMMARY_COLUMNS
+        rows: dict[str, dict] = {}
+        missing: List[str] = []
+        for meeting_id in dict.fromkeys(meeting_ids):
+            cached = self._meeting_cache.get((meeting_id, source_id)) if use_cache else _MISSING
+            if cached is _MISSING:
+                missing.append(meeting_id)
+            elif cached is not None:
+                rows[meeting_id] = cached
+
+        for start in range(0, len(missing), IN_FILTER_BATCH_SIZE):
+            batch = missing[start:start + IN_FILTER_BATCH_SIZE]
+            try:
+                response = self.supabase.table("scraped_meetings").select(columns).eq(
+                    "source_id", source_id
+                ).in_("meeting_id", batch).execute()
+            except Exception as e:
+                logger.error("Error fetching meetings", source_id=source_id, count=len(batch), error=str(e))
+                continue
+
+            found = {row["meeting_id"]: row for row in response.data or []}
+            rows.update(found)
+            if use_cache:
+                for meeting_id in batch:
+                    self._meeting_cache.set((meeting_id, source_id), found.get(meeting_id))
+        return rows
+
     def get_meetings_by_source(
         self,
         source_id: str,
         since: Optional[datetime] = None,
-        until: Optional[datetime] = None
+        until: Optional[datetime] = None,
+        columns: str = MEETING_SUMMARY_COLUMNS
     ) -> List[dict]:
-        """Get all meetings for a source, optionally filtered by date range."""
+        """
+        Get all meetings for a source, optionally filtered by date range.
+
+        pdf_content is left out by default; pass columns="*" to include it.
+        """
         try:
-            query = self.supabase.table("scraped_meetings").select("*").eq(
+            query = self.supabase.table("scraped_meetings").select(columns).eq(
                 "source_id", source_id
             )
 
@@ -97,15 +334,10 @@ class Database:
         - metadata: dict
         """
         try:
-            # Ensure datetime fields are ISO strings
-            if isinstance(meeting_data.get('meeting_date'), datetime):
-                meeting_data['meeting_date'] = meeting_data['meeting_date'].isoformat()
-            if isinstance(meeting_data.get('agenda_posted_date'), datetime):
-                meeting_data['agenda_posted_date'] = meeting_data['agenda_posted_date'].isoformat()
-
-            # Add timestamps
-            meeting_data['last_scraped_at'] = datetime.now().isoformat()
+            # Ensure datetime fields are ISO strings and add timestamps
+            _normalize_meeting_rows([meeting_data], _now_iso())
 
+            self._invalidate_meeting(meeting_data)
             response = self.supabase.table("scraped_meetings").upsert(
                 meeting_data,
                 on_conflict="meeting_id,source_id"
@@ -121,11 +353,65 @@ class Database:
             logger.error("Error upserting meeting", error=str(e), data=meeting_data)
             return False
 
+    def upsert_meetings(self, meetings: List[dict], batch_size: int = UPSERT_BATCH_SIZE) -> int:
+        """
+        Insert or update many meeting records in batched round-trips.
+
+        Each dict takes the same fields as upsert_meeting(). Rows in one call
+        should share the same keys: PostgREST bulk upserts send a single column
+        list, so a key missing from one row is written as NULL for that row.
+
+        Args:
+            meetings: Meeting rows to write
+            batch_size: Rows per upsert request
+
+        Returns:
+            Number of meetings written
+        """
+        return len(self.upsert_meetings_written(meetings, batch_size))
+
+    def upsert_meetings_written(
+        self,
+        meetings: List[dict],
+        batch_size: int = UPSERT_BATCH_SIZE
+    ) -> Set[Tuple[str, str]]:
+        """
+        Batched upsert_meetings() that reports which rows were written.
+
+        A failed batch is logged and skipped, so callers that count new or
+        updated meetings should only count the keys returned here.
+
+        Returns:
+            (meeting_id, source_id) keys of the rows written
+        """
+        written: Set[Tuple[str, str]] = set()
+        if not meetings:
+            return written
+
+        _normalize_meeting_rows(meetings, _now_iso())
+        for meeting_data in meetings:
+            self._invalidate_meeting(meeting_data)
+
+        for start in range(0, len(meetings), batch_size):
+            batch = meetings[start:start + batch_size]
+            try:
+                self.supabase.table("scraped_meetings").upsert(
+                    batch,
+                    on_conflict="meeting_id,source_id"
+                ).execute()
+                written.update((m.get('meeting_id'), m.get('source_id')) for m in batch)
+            except Exception as e:
+                logger.error("Error upserting meetings", error=str(e), batch_size=len(batch))
+
+        logger.debug("Upserted meetings", requested=len(meetings), written=len(written))
+        return written
+
     def mark_meeting_analyzed(self, meeting_id: str, source_id: str, report_id: str) -> bool:
         """Mark a meeting as analyzed with the associated report ID."""
+        self._meeting_cache.discard((meeting_id, source_id))
         try:
             response = self.supabase.table("scraped_meetings").update({
-                "last_analyzed_at": datetime.now().isoformat(),
+                "last_analyzed_at": _now_iso(),
                 "report_id": report_id
             }).eq("meeting_id", meeting_id).eq("source_id", source_id).execute()
             return True
@@ -133,10 +419,19 @@ class Database:
             logger.error("Error marking meeting analyzed", meeting_id=meeting_id, error=str(e))
             return False
 
-    def get_unanalyzed_meetings(self, source_id: str, with_agenda_only: bool = True) -> List[dict]:
-        """Get meetings that haven't been analyzed yet."""
+    def get_unanalyzed_meetings(
+        self,
+        source_id: str,
+        with_agenda_only: bool = True,
+        columns: str = MEETING_SUMMARY_COLUMNS
+    ) -> List[dict]:
+        """
+        Get meetings that haven't been analyzed yet.
+
+        pdf_content is left out by default; pass columns="*" to include it.
+        """
         try:
-            query = self.supabase.table("scraped_meetings").select("*").eq(
+            query = self.supabase.table("scraped_meetings").select(columns).eq(
                 "source_id", source_id
             ).is_("last_analyzed_at", "null")
 
@@ -149,20 +444,76 @@ class Database:
             logger.error("Error fetching unanalyzed meetings", source_id=source_id, error=str(e))
             return []
 
-    def meeting_content_changed(self, meeting_id: str, source_id: str, new_content: str) -> bool:
-        """Check if meeting content has changed by comparing content hashes."""
-        new_hash = hashlib.sha256(new_content.encode()).hexdigest()
+    def meeting_content_changed(
+        self,
+        meeting_id: str,
+        source_id: str,
+        new_content: Union[str, bytes]
+    ) -> bool:
+        """
+        Check if meeting content has changed by comparing content hashes.
 
-        existing = self.get_meeting(meeting_id, source_id)
-        if not existing:
+        A row already in the get_meeting() read cache answers without a
+        round-trip (the summary projection includes content_hash).
+        """
+        new_hash = self.compute_content_hash(new_content)
+
+        row = self._meeting_cache.get((meeting_id, source_id))
+        if row is _MISSING:
+            try:
+                # Only the hash is needed - don't drag back the stored pdf_content
+                response = self.supabase.table("scraped_meetings").select("content_hash").eq(
+                    "meeting_id", meeting_id
+                ).eq("source_id", source_id).execute()
+            except Exception as e:
+                logger.error("Error fetching meeting hash", meeting_id=meeting_id, error=str(e))
+                return True
+            row = response.data[0] if response.data else None
+
+        if row is None:
             return True  # New meeting, treat as changed
 
-        old_hash = existing.get('content_hash')
-        return old_hash != new_hash
+        return row.get('content_hash') != new_hash
+
+    def get_content_hashes(self, source_id: str, meeting_ids: List[str]) -> dict[str, Optional[str]]:
+        """
+        Fetch stored content hashes for many meetings of one source.
+
+        One SELECT per IN_FILTER_BATCH_SIZE ids instead of one per meeting.
+        Meetings with no row are absent from the result; on error the batch
+        is skipped so callers treat those meetings as changed.
+        """
+        hashes: dict[str, Optional[str]] = {}
+        ids = list(dict.fromkeys(meeting_ids))
+        for start in range(0, len(ids), IN_FILTER_BATCH_SIZE):
+            batch = ids[start:start + IN_FILTER_BATCH_SIZE]
+            try:
+                response = self.supabase.table("scraped_meetings").select(
+                    "meeting_id,content_hash"
+                ).eq("source_id", source_id).in_("meeting_id", batch).execute()
+            except Exception as e:
+                logger.error("Error fetching meeting hashes", source_id=source_id, count=len(batch), error=str(e))
+                continue
+            for row in response.data or []:
+                hashes[row["meeting_id"]] = row.get("content_hash")
+        return hashes
+
+    def compute_content_hash(self, content: Union[str, bytes]) -> str:
+        """
+        Compute a SHA256 hex hash of content for change detection.
+
+        Bytes are hashed directly. Text is encoded and hashed in fixed-size
+        slices so large PDF extracts never need a second full-size UTF-8 copy.
+        """
+        digest = hashlib.sha256()
+
+        if isinstance(content, (bytes, bytearray, memoryview)):
+            digest.update(content)
+        else:
+            for start in range(0, len(content), HASH_CHUNK_CHARS):
+                digest.update(content[start:start + HASH_CHUNK_CHARS].encode())
 
-    def compute_content_hash(self, content: str) -> str:
-        """Compute SHA256 hash of content."""
-        return hashlib.sha256(content.encode()).hexdigest()
+        return digest.hexdigest()
 
     # =========================================================================
     # Document Storage (for extracted PDF content)
@@ -186,8 +537,9 @@ class Database:
         - metadata: dict
         """
         try:
-            document_data['created_at'] = datetime.now().isoformat()
+            document_data['created_at'] = _now_iso()
 
+            self._document_cache.discard(document_data.get('document_id'))
             response = self.supabase.table("documents").upsert(
                 document_data,
                 on_conflict="document_id"
@@ -199,20 +551,61 @@ class Database:
             logger.error("Error saving document", error=str(e))
             return False
 
+    def save_documents(self, documents: List[dict], batch_size: int = UPSERT_BATCH_SIZE) -> int:
+        """
+        Save many extracted documents in batched round-trips.
+
+        Each dict takes the same fields as save_document() and rows in one
+        call should share the same keys (see upsert_meetings()).
+
+        Args:
+            documents: Document rows to write
+            batch_size: Rows per upsert request (lower it for very large content)
+
+        Returns:
+            Number of documents written
+        """
+        if not documents:
+            return 0
+
+        created_at = _now_iso()
+        for document_data in documents:
+            document_data['created_at'] = created_at
+            self._document_cache.discard(document_data.get('document_id'))
+
+        written = 0
+        for start in range(0, len(documents), batch_size):
+            batch = documents[start:start + batch_size]
+            try:
+                self.supabase.table("documents").upsert(
+                    batch,
+                    on_conflict="document_id"
+                ).execute()
+                written += len(batch)
+            except Exception as e:
+                logger.error("Error saving documents", error=str(e), batch_size=len(batch))
+
+        logger.debug("Saved documents", requested=len(documents), written=written)
+        return written
+
     def get_document(self, document_id: str) -> Optional[dict]:
-        """Get a document by ID."""
+        """Get a document by ID (served from a short TTL cache; treat as read-only)."""
+        cached = self._document_cache.get(document_id)
+        if cached is not _MISSING:
+            return cached
+
         try:
             response = self.supabase.table("documents").select("*").eq(
                 "document_id", document_id
             ).execute()
-
-            if response.data and len(response.data) > 0:
-                return response.data[0]
-            return None
         except Exception as e:
             logger.error("Error fetching document", document_id=document_id, error=str(e))
             return None
 
+        row = response.data[0] if response.data else None
+        self._document_cache.set(document_id, row)
+        return row
+
     # =========================================================================
     # Deep Research Reports (Layer 2 Analysis)
     # =========================================================================
@@ -221,42 +614,47 @@ class Database:
         self,
         source_id: str,
         min_relevance: float = 0.7,
-        needs_deep_research: bool = True
+        needs_deep_research: bool = True,
+        limit: Optional[int] = None,
+        columns: str = REPORT_COLUMNS
     ) -> List[dict]:
         """
         Get reports with high relevance scores that may need deep research.
 
+        Filtering and ordering happen server-side on data->relevance_score
+        (indexed by migrations/003 and 004), so the most relevant rows come
+        back first and a small limit reads only the top of the index.
+
         Args:
             source_id: Source ID to filter by
             min_relevance: Minimum relevance score (0.0-1.0)
             needs_deep_research: If True, only return reports without deep research
+            limit: Maximum number of reports to return (most relevant first)
+            columns: Columns to select (PostgREST select syntax)
 
         Returns:
             List of report dicts
         """
         try:
-            query = self.supabase.table("reports").select("*").eq("type", "scout")
-
-            # Filter by relevance in the JSON data
-            # Note: This assumes reports have data->relevance_score field
-            response = query.order("created_at", desc=True).limit(50).execute()
-
-            results = []
-            for report in response.data or []:
-                data = report.get('data', {})
-                relevance = data.get('relevance_score', 0)
-
-                # Check relevance threshold
-                if relevance < min_relevance:
-                    continue
+            # data->relevance_score keeps the value as jsonb, so PostgREST
+            # compares it numerically rather than as text
+            query = self.supabase.table("reports").select(columns).eq("type", "scout").filter(
+                "data->relevance_score", "gte", str(min_relevance)
+            )
 
-                # Check if deep research already done
-                if needs_deep_research and report.get('deep_research_id'):
-                    continue
+            # Skip reports that already have deep research
+            if needs_deep_research:
+                query = query.is_("deep_research_id", "null")
 
-                results.append(report)
+            # Highest relevance first; newest breaks ties
+            query = query.order("data->relevance_score", desc=True, nullsfirst=False).order(
+                "created_at", desc=True
+            )
+            if limit is not None:
+                query = query.limit(limit)
 
-            return results
+            response = query.execute()
+            return response.data or []
         except Exception as e:
             logger.error("Error fetching high relevance reports", source_id=source_id, error=str(e))
             return []
@@ -274,13 +672,13 @@ class Database:
         """
         try:
             # Save the deep research report
-            data = json.loads(deep_report.model_dump_json())
+            data = deep_report.model_dump(mode="json")
             deep_report_id = f"deep-{deep_report.report_id}"
 
             payload = {
                 "id": deep_report_id,
                 "type": "deep_research",
-                "created_at": datetime.now().isoformat(),
+                "created_at": _now_iso(),
                 "data": data,
                 "original_report_id": original_report_id
             }
@@ -306,7 +704,124 @@ class Database:
             )
             return False
 
-import threading
+    # =========================================================================
+    # Async Variants
+    #
+    # Mirror the sync meeting methods on supabase-py's async client so many
+    # reads/writes can be in flight at once. The async client keeps its own
+    # connection pool, so use these from one long-lived event loop.
+    # =========================================================================
+
+    async def _get_async_client(self) -> "AsyncClient":
+        """Get (or lazily create) the async Supabase client."""
+        if self._async_supabase is None:
+            import httpx
+            from supabase import AsyncClientOptions, acreate_client
+
+            http_client = httpx.AsyncClient(limits=_http_limits(), timeout=HTTP_TIMEOUT_SECONDS)
+            self._async_supabase = await acreate_client(
+                SUPABASE_URL, SUPABASE_KEY, options=AsyncClientOptions(httpx_client=http_client)
+            )
+        return self._async_supabase
+
+    async def aget_meeting(
+        self,
+        meeting_id: str,
+        source_id: str,
+        columns: str = MEETING_SUMMARY_COLUMNS
+    ) -> Optional[dict]:
+        """Async variant of get_meeting()."""
+        use_cache = columns == MEETING_SUMMARY_COLUMNS
+        if use_cache:
+            cached = self._meeting_cache.get((meeting_id, source_id))
+            if cached is not _MISSING:
+                return cached
+
+        try:
+            client = await self._get_async_client()
+            response = await client.table("scraped_meetings").select(columns).eq(
+                "meeting_id", meeting_id
+            ).eq("source_id", source_id).execute()
+        except Exception as e:
+            logger.error("Error fetching meeting", meeting_id=meeting_id, error=str(e))
+            return None
+
+        row = response.data[0] if response.data else None
+        if use_cache:
+            self._meeting_cache.set((meeting_id, source_id), row)
+        return row
+
+    async def aupsert_meeting(self, meeting_data: dict) -> bool:
+        """Async variant of upsert_meeting()."""
+        try:
+            _normalize_meeting_rows([meeting_data], _now_iso())
+
+            self._invalidate_meeting(meeting_data)
+            client = await self._get_async_client()
+            await client.table("scraped_meetings").upsert(
+                meeting_data,
+                on_conflict="meeting_id,source_id"
+            ).execute()
+
+            logger.debug(
+                "Upserted meeting",
+                meeting_id=meeting_data.get('meeting_id'),
+                source_id=meeting_data.get('source_id')
+            )
+            return True
+        except Exception as e:
+            logger.error("Error upserting meeting", error=str(e), data=meeting_data)
+            return False
+
+    async def aget_meetings(
+        self,
+        keys: List[tuple[str, str]],
+        columns: str = MEETING_SUMMARY_COLUMNS,
+        concurrency: int = ASYNC_CONCURRENCY
+    ) -> dict[tuple[str, str], Optional[dict]]:
+        """
+        Fetch many meetings concurrently.
+
+        Args:
+            keys: (meeting_id, source_id) pairs
+            columns: Columns to select
+            concurrency: Max requests in flight
+
+        Returns:
+            Dict mapping each (meeting_id, source_id) to its row or None
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(meeting_id: str, source_id: str) -> Optional[dict]:
+            async with semaphore:
+                return await self.aget_meeting(meeting_id, source_id, columns)
+
+        rows = await asyncio.gather(*(fetch(m, s) for m, s in keys))
+        return dict(zip(keys, rows))
+
+    async def aupsert_meetings_concurrently(
+        self,
+        meetings: List[dict],
+        concurrency: int = ASYNC_CONCURRENCY
+    ) -> int:
+        """
+        Upsert meetings as concurrent single-row requests.
+
+        Prefer upsert_meetings() when rows share the same keys; this is for
+        heterogeneous rows that can't go in one bulk request.
+
+        Returns:
+            Number of meetings written
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def upsert(meeting_data: dict) -> bool:
+            async with semaphore:
+                return await self.aupsert_meeting(meeting_data)
+
+        results = await asyncio.gather(*(upsert(m) for m in meetings))
+        return sum(results)
+
 
 _db: Database | None = None
 _db_lock = threading.Lock()
@@ -318,7 +833,8 @@ def get_db() -> Database:
         Database: The database instance.
 
     Raises:
-        ValueError: If SUPABASE_URL or SUPABASE_KEY are not set.
+        ValueError: If SUPABASE_URL or SUPABASE_KEY are not set (nothing is
+            stored, so a later call retries once the environment is fixed).
     """
     global _db
     if _db is None:
@@ -7,7 +7,9 @@ consistent behavior and interface.
 
 import re
 from abc import ABC, abstractmethod
-from typing import List, Optional, Any, Dict
+from functools import lru_cache
+from operator import attrgetter
+from typing import List, Optional, Any, Callable, Dict
 
 from src.intelligence.models import (
     CivicEvent,
@@ -20,6 +22,177 @@ from src.logging_config import get_logger
 
 logger = get_logger("intelligence.adapters")
 
+# Entity patterns, compiled once at import. The two organization patterns
+# stay separate passes: a single alternation would return only the longest
+# match at each position and drop overlaps ("ABC Development" inside
+# "ABC Development LLC") that the adapters currently emit.
+_ORG_PATTERNS = (
+    re.compile(r'\b([A-Z][A-Za-z\s]+(?:LLC|Inc|Corp|Corporation|Company|Co|Ltd|LP|LLP)\.?)\b'),
+    re.compile(r'\b([A-Z][A-Za-z\s]+(?:Development|Properties|Builders|Construction|Realty))\b'),
+)
+_ADDRESS_PATTERN = re.compile(
+    r'\b(\d+\s+[A-Z][A-Za-z\s]+(?:Street|St|Avenue|Ave|Road|Rd|Drive|Dr|Lane|Ln|Boulevard|Blvd|Way|Court|Ct)\.?(?:\s+[A-Z]{2}\s+\d{5})?)\b',
+    re.IGNORECASE,
+)
+_NON_ID_CHARS = re.compile(r'[^a-z0-9]+')
+
+# ASCII fast path for _normalize_id_text: every byte outside [a-z0-9] -> '-'
+_ID_BYTE_TABLE = bytes(
+    b if (0x61 <= b <= 0x7A or 0x30 <= b <= 0x39) else 0x2D
+    for b in range(256)
+)
+
+# Civic watchdog keywords (matched case-insensitively as substrings)
+_KEYWORD_TAGS: Dict[str, tuple[str, ...]] = {
+    "rezoning": ("rezone", "rezoning", "zoning change", "land use change"),
+    "development": ("development", "subdivision", "plat", "site plan"),
+    "environmental": ("environmental", "wetland", "aquifer", "water quality", "stormwater"),
+    "permit": ("permit", "application", "approval"),
+    "public-hearing": ("public hearing", "public comment", "public notice"),
+    "budget": ("budget", "appropriation", "funding", "expenditure"),
+    "variance": ("variance", "exception", "waiver"),
+    "annexation": ("annexation", "annex"),
+    "comprehensive-plan": ("comprehensive plan", "comp plan", "future land use"),
+    "water": ("water", "well", "aquifer", "groundwater", "santa fe river"),
+}
+
+
+# Memo sizes for the pure text helpers below. The same titles, boards,
+# counties and categories come back on every scheduled re-scrape, so a
+# long-running worker mostly hits these caches.
+ID_CACHE_SIZE = 8192
+TEXT_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=ID_CACHE_SIZE)
+def _normalize_id_text(text: str) -> str:
+    """
+    Lowercase, dash-join and truncate text for use in IDs.
+
+    Memoized: board and organization names repeat across a scrape.
+    """
+    normalized = text.lower()
+    if normalized.isascii():
+        # bytes.translate + split/join collapses and trims '-' runs in C,
+        # matching the regex path below
+        parts = normalized.encode().translate(_ID_BYTE_TABLE).split(b'-')
+        return b'-'.join(filter(None, parts)).decode()[:50]
+
+    normalized = _NON_ID_CHARS.sub('-', normalized.strip())
+    normalized = normalized.strip('-')
+    return normalized[:50]
+
+
+def fields_getter(*fields: str) -> Callable[[Any], tuple]:
+    """
+    Build a reader returning the named attributes of an object as a tuple.
+
+    The common case is one C-level attrgetter call; objects missing any
+    of the attributes fall back to getattr(obj, field, None) per field.
+    """
+    getter = attrgetter(*fields)
+
+    def read(obj: Any) -> tuple:
+        try:
+            return getter(obj)
+        except AttributeError:
+            return tuple(getattr(obj, name, None) for name in fields)
+
+    return read
+
+
+@lru_cache(maxsize=ID_CACHE_SIZE)
+def _county_tags(county: str) -> tuple[str, ...]:
+    """
+    Return the tags for a county name: its slug, plus "alachua-county"
+    for Alachua.
+
+    Memoized: a source only ever reports a handful of counties, so each
+    notice reuses the same tag strings.
+    """
+    normalized = county.lower()
+    slug = normalized.replace(" ", "-")
+    if normalized == "alachua":
+        return (slug, "alachua-county")
+    return (slug,)
+
+
+@lru_cache(maxsize=1)
+def _tag_automaton() -> Optional[Any]:
+    """
+    Compile _KEYWORD_TAGS into one Aho-Corasick automaton (keyword -> tags).
+
+    Returns None if pyahocorasick is not installed; callers then fall back
+    to per-keyword substring checks.
+    """
+    try:
+        import ahocorasick
+    except ImportError:
+        return None
+
+    tags_by_keyword: Dict[str, List[str]] = {}
+    for tag, keywords in _KEYWORD_TAGS.items():
+        for keyword in keywords:
+            tags_by_keyword.setdefault(keyword, []).append(tag)
+
+    automaton = ahocorasick.Automaton()
+    for keyword, tags in tags_by_keyword.items():
+        automaton.add_word(keyword, tuple(tags))
+    automaton.make_automaton()
+    return automaton
+
+
+@lru_cache(maxsize=TEXT_CACHE_SIZE)
+def _scan_entities(text: str) -> tuple[tuple[EntityType, str, str], ...]:
+    """
+    Run the entity patterns over text.
+
+    Returns (entity_type, name, entity_id) tuples rather than Entity objects
+    so cached results are immutable; callers build fresh Entities.
+    """
+    found = []
+
+    # Extract organization patterns (LLC, Inc, Corp, etc.)
+    # finditer + raw-length check skips short matches before stripping;
+    # stripping never lengthens a match, so the filter is unchanged
+    for pattern in _ORG_PATTERNS:
+        for match in pattern.finditer(text):
+            name = match.group(1)
+            if len(name) <= 3:
+                continue
+            name = name.strip()
+            if len(name) > 3:
+                found.append((EntityType.ORGANIZATION, name, f"org-{_normalize_id_text(name)}"))
+
+    # Extract address patterns
+    for match in _ADDRESS_PATTERN.finditer(text):
+        address = match.group(1)
+        if len(address) <= 10:
+            continue
+        address = address.strip()
+        if len(address) > 10:
+            found.append((EntityType.ADDRESS, address, f"addr-{_normalize_id_text(address)}"))
+
+    return tuple(found)
+
+
+@lru_cache(maxsize=TEXT_CACHE_SIZE)
+def _scan_tags(text: str) -> tuple[str, ...]:
+    """Match _KEYWORD_TAGS against text, returning tags in table order."""
+    text_lower = text.lower()
+
+    automaton = _tag_automaton()
+    if automaton is not None:
+        found = {tag for _, matched in automaton.iter(text_lower) for tag in matched}
+    else:
+        found = {
+            tag for tag, keywords in _KEYWORD_TAGS.items()
+            if any(kw in text_lower for kw in keywords)
+        }
+
+    # Keep _KEYWORD_TAGS order so output is stable
+    return tuple(tag for tag in _KEYWORD_TAGS if tag in found)
+
 
 class BaseAdapter(ABC):
     """
@@ -60,45 +233,15 @@ class BaseAdapter(ABC):
             text: Text to extract entities from
             
         Returns:
-            List of extracted Entity objects
+            List of extracted Entity objects (fresh instances per call)
         """
-        entities = []
+        if not text or text.isspace():
+            return []
         
-        if not text:
-            return entities
-        
-        # Extract organization patterns (LLC, Inc, Corp, etc.)
-        org_patterns = [
-            r'\b([A-Z][A-Za-z\s]+(?:LLC|Inc|Corp|Corporation|Company|Co|Ltd|LP|LLP)\.?)\b',
-            r'\b([A-Z][A-Za-z\s]+(?:Development|Properties|Builders|Construction|Realty))\b',
+        return [
+            Entity(entity_id=entity_id, entity_type=entity_type, name=name)
+            for entity_type, name, entity_id in _scan_entities(text)
         ]
-        
-        for pattern in org_patterns:
-            matches = re.findall(pattern, text)
-            for match in matches:
-                name = match.strip()
-                if len(name) > 3:
-                    entity_id = f"org-{self._normalize_for_id(name)}"
-                    entities.append(Entity(
-                        entity_id=entity_id,
-                        entity_type=EntityType.ORGANIZATION,
-                        name=name,
-                    ))
-        
-        # Extract address patterns
-        address_pattern = r'\b(\d+\s+[A-Z][A-Za-z\s]+(?:Street|St|Avenue|Ave|Road|Rd|Drive|Dr|Lane|Ln|Boulevard|Blvd|Way|Court|Ct)\.?(?:\s+[A-Z]{2}\s+\d{5})?)\b'
-        address_matches = re.findall(address_pattern, text, re.IGNORECASE)
-        for match in address_matches:
-            address = match.strip()
-            if len(address) > 10:
-                entity_id = f"addr-{self._normalize_for_id(address)}"
-                entities.append(Entity(
-                    entity_id=entity_id,
-                    entity_type=EntityType.ADDRESS,
-                    name=address,
-                ))
-        
-        return entities
     
     def extract_tags_from_text(self, text: str) -> List[str]:
         """
@@ -110,39 +253,18 @@ class BaseAdapter(ABC):
         Returns:
             List of tag strings
         """
-        tags = []
-        
-        if not text:
-            return tags
+        if not text or text.isspace():
+            return []
         
-        text_lower = text.lower()
-        
-        # Civic watchdog keywords
-        keyword_tags = {
-            "rezoning": ["rezone", "rezoning", "zoning change", "land use change"],
-            "development": ["development", "subdivision", "plat", "site plan"],
-            "environmental": ["environmental", "wetland", "aquifer", "water quality", "stormwater"],
-            "permit": ["permit", "application", "approval"],
-            "public-hearing": ["public hearing", "public comment", "public notice"],
-            "budget": ["budget", "appropriation", "funding", "expenditure"],
-            "variance": ["variance", "exception", "waiver"],
-            "annexation": ["annexation", "annex"],
-            "comprehensive-plan": ["comprehensive plan", "comp plan", "future land use"],
-            "water": ["water", "well", "aquifer", "groundwater", "santa fe river"],
-        }
-        
-        for tag, keywords in keyword_tags.items():
-            if any(kw in text_lower for kw in keywords):
-                tags.append(tag)
-        
-        return tags
+        return list(_scan_tags(text))
     
     def _normalize_for_id(self, text: str) -> str:
         """Normalize text for use in IDs."""
-        normalized = text.lower().strip()
-        normalized = re.sub(r'[^a-z0-9]+', '-', normalized)
-        normalized = normalized.strip('-')
-        return normalized[:50]
+        return _normalize_id_text(text)
+    
+    def _county_tags(self, county: Optional[str]) -> tuple[str, ...]:
+        """Tags for a county name (slug, plus "alachua-county" for Alachua)."""
+        return _county_tags(county) if county else ()
     
     def _create_document(
         self,
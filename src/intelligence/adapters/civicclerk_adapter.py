@@ -5,6 +5,8 @@ Transforms CivicClerkMeeting objects into the unified CivicEvent model.
 """
 
 from datetime import datetime
+from functools import lru_cache
+from types import SimpleNamespace
 from typing import List, Optional, Any
 
 from src.intelligence.models import (
@@ -19,6 +21,43 @@ from src.logging_config import get_logger
 
 logger = get_logger("intelligence.adapters.civicclerk")
 
+# Tags every CivicClerk meeting event carries
+_DEFAULT_TAGS = ("meeting", "alachua-county")
+
+# Common CivicClerk date formats (mutually exclusive, so order only
+# affects how many misses are tried, never the result)
+_DATE_FORMATS = (
+    "%Y-%m-%d",
+    "%m/%d/%Y",
+    "%B %d, %Y",
+)
+
+# Tried first: a portal sticks to one format, so after the first hit the
+# remaining formats (each miss raises ValueError) are skipped.
+_preferred_date_format = _DATE_FORMATS[0]
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_string(date: str) -> Optional[datetime]:
+    """
+    Parse a date string with the first matching format, or None.
+
+    Memoized: a scrape repeats the same handful of dates, and each format
+    miss costs a raised ValueError. Unparseable strings cache as None so
+    the caller's datetime.now() fallback is never frozen in the cache.
+    """
+    global _preferred_date_format
+
+    preferred = _preferred_date_format
+    for fmt in (preferred, *(f for f in _DATE_FORMATS if f != preferred)):
+        try:
+            parsed = datetime.strptime(date, fmt)
+        except ValueError:
+            continue
+        _preferred_date_format = fmt
+        return parsed
+    return None
+
 
 class CivicClerkAdapter(BaseAdapter):
     """
@@ -37,6 +76,7 @@ class CivicClerkAdapter(BaseAdapter):
         """
         self.site_id = site_id
         self._source_id = f"civicclerk-{site_id}"
+        self._event_id_prefix = f"{self._source_id}-"
     
     @property
     def source_id(self) -> str:
@@ -53,10 +93,11 @@ class CivicClerkAdapter(BaseAdapter):
             List of CivicEvent objects
         """
         events = []
+        convert = self._convert_meeting
         
         for meeting in meetings:
             try:
-                event = self._convert_meeting(meeting)
+                event = convert(meeting)
                 if event:
                     events.append(event)
             except Exception as e:
@@ -74,8 +115,19 @@ class CivicClerkAdapter(BaseAdapter):
         
         return events
     
-    def _convert_meeting(self, meeting: Any) -> Optional[CivicEvent]:
-        """Convert a single CivicClerkMeeting to CivicEvent."""
+    def _convert_meeting(
+        self,
+        meeting: Any,
+        raw_data: Optional[dict] = None,
+    ) -> Optional[CivicEvent]:
+        """
+        Convert a single CivicClerkMeeting (or attribute view) to CivicEvent.
+        
+        Args:
+            meeting: Object exposing meeting fields as attributes
+            raw_data: Raw record to store on the event (defaults to a summary
+                of the meeting's fields)
+        """
         # Extract meeting attributes
         meeting_id = getattr(meeting, 'meeting_id', None)
         title = getattr(meeting, 'title', 'Unknown Meeting')
@@ -90,7 +142,7 @@ class CivicClerkAdapter(BaseAdapter):
             return None
         
         # Build event ID
-        event_id = f"civicclerk-{self.site_id}-{meeting_id}"
+        event_id = self._event_id_prefix + str(meeting_id)
         
         # Parse timestamp
         timestamp = self._parse_datetime(date, time)
@@ -118,8 +170,7 @@ class CivicClerkAdapter(BaseAdapter):
         
         # Extract tags
         tags = self.extract_tags_from_text(title)
-        tags.append("meeting")
-        tags.append("alachua-county")
+        tags.extend(_DEFAULT_TAGS)
         
         # Add board-specific tags
         if board:
@@ -147,14 +198,14 @@ class CivicClerkAdapter(BaseAdapter):
         event = CivicEvent(
             event_id=event_id,
             event_type=EventType.MEETING,
-            source_id=self.source_id,
+            source_id=self._source_id,
             timestamp=timestamp,
             title=title,
             description=description,
             entities=entities,
             documents=documents,
-            tags=list(set(tags)),
-            raw_data={
+            tags=list(dict.fromkeys(tags)),  # dedupe, keep order
+            raw_data=raw_data if raw_data is not None else {
                 "meeting_id": meeting_id,
                 "board": board,
                 "status": status,
@@ -175,17 +226,9 @@ class CivicClerkAdapter(BaseAdapter):
             return date
         
         if isinstance(date, str):
-            # Try common formats
-            formats = [
-                "%Y-%m-%d",
-                "%m/%d/%Y",
-                "%B %d, %Y",
-            ]
-            for fmt in formats:
-                try:
-                    return datetime.strptime(date, fmt)
-                except ValueError:
-                    continue
+            parsed = _parse_date_string(date)
+            if parsed is not None:
+                return parsed
         
         # Fallback to now
         return datetime.now()
@@ -219,47 +262,16 @@ class CivicClerkAdapter(BaseAdapter):
         return events
     
     def _convert_meeting_dict(self, meeting: dict) -> Optional[CivicEvent]:
-        """Convert a meeting dictionary to CivicEvent."""
+        """
+        Convert a meeting dictionary to CivicEvent.
+        
+        Shares _convert_meeting() via an attribute view of the dict, so dict
+        input gets the same description, board tags and metadata. The
+        original dict is kept as raw_data.
+        """
         meeting_id = meeting.get('meeting_id') or meeting.get('id')
         if not meeting_id:
             return None
         
-        title = meeting.get('title', 'Unknown Meeting')
-        date = meeting.get('date')
-        time = meeting.get('time')
-        board = meeting.get('board')
-        
-        event_id = f"civicclerk-{self.site_id}-{meeting_id}"
-        timestamp = self._parse_datetime(date, time)
-        
-        entities = self.extract_entities_from_text(title)
-        if board:
-            entities.append(Entity(
-                entity_id=f"gov-{self._normalize_for_id(board)}",
-                entity_type=EntityType.GOVERNMENT_BODY,
-                name=board,
-            ))
-        
-        tags = self.extract_tags_from_text(title)
-        tags.extend(["meeting", "alachua-county"])
-        
-        documents = []
-        if meeting.get('agenda_url'):
-            documents.append(Document(
-                document_id=f"agenda-{meeting_id}",
-                title=f"Agenda - {title}",
-                url=meeting['agenda_url'],
-                document_type="agenda",
-            ))
-        
-        return CivicEvent(
-            event_id=event_id,
-            event_type=EventType.MEETING,
-            source_id=self.source_id,
-            timestamp=timestamp,
-            title=title,
-            entities=entities,
-            documents=documents,
-            tags=list(set(tags)),
-            raw_data=meeting,
-        )
+        view = SimpleNamespace(**{**meeting, 'meeting_id': meeting_id})
+        return self._convert_meeting(view, raw_data=meeting)
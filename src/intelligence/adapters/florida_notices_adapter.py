@@ -4,8 +4,11 @@ Florida Notices adapter for converting public notice data to CivicEvents.
 Transforms PublicNotice objects into the unified CivicEvent model.
 """
 
+import re
 from datetime import datetime
-from typing import List, Optional, Any
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import Any, Iterable, Iterator, List, Optional
 
 from src.intelligence.models import (
     CivicEvent,
@@ -15,11 +18,61 @@ from src.intelligence.models import (
     Document,
     GeoLocation,
 )
-from src.intelligence.adapters.base_adapter import BaseAdapter
+from src.intelligence.adapters.base_adapter import BaseAdapter, fields_getter
 from src.logging_config import get_logger
 
 logger = get_logger("intelligence.adapters.florida_notices")
 
+# Notice date formats, in the order they are tried
+_DATE_FORMATS = (
+    "%Y-%m-%d",
+    "%m/%d/%Y",
+    "%B %d, %Y",
+    "%b %d, %Y",
+)
+
+# Cheap shape checks that pick the candidate format(s) up front, so a
+# typical date costs one strptime instead of raising ValueError per miss
+_DATE_DISPATCH = (
+    (re.compile(r"\d{4}-\d{1,2}-\d{1,2}"), ("%Y-%m-%d",)),
+    (re.compile(r"\d{1,2}/\d{1,2}/\d{4}"), ("%m/%d/%Y",)),
+    (re.compile(r"[A-Za-z]+ \d{1,2}, \d{4}"), ("%B %d, %Y", "%b %d, %Y")),
+)
+
+# PublicNotice attributes read by _convert_notice (missing ones read as None)
+_read_notice = fields_getter(
+    "notice_id", "title", "newspaper", "county", "publication_date",
+    "category", "keywords", "content", "pdf_url", "detail_url",
+)
+
+# Joins title and content for a single extraction pass. '|' is outside
+# every entity pattern's character class and absent from the tag
+# keywords, so no match can span the two segments.
+_SEGMENT_SEP = "\n|\n"
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_string(date: str) -> Optional[datetime]:
+    """
+    Parse a notice date string, or return None if no format matches.
+
+    Memoized (notice dates repeat heavily within a run). The dispatched
+    format(s) go first and the rest remain as fallbacks; the formats are
+    mutually exclusive, so results match trying every format in order.
+    """
+    candidates = _DATE_FORMATS
+    for pattern, formats in _DATE_DISPATCH:
+        if pattern.fullmatch(date):
+            candidates = formats + tuple(f for f in _DATE_FORMATS if f not in formats)
+            break
+
+    for fmt in candidates:
+        try:
+            return datetime.strptime(date, fmt)
+        except ValueError:
+            continue
+    return None
+
 
 class FloridaNoticesAdapter(BaseAdapter):
     """
@@ -37,51 +90,74 @@ class FloridaNoticesAdapter(BaseAdapter):
     def source_id(self) -> str:
         return self._source_id
     
-    def adapt(self, notices: List[Any]) -> List[CivicEvent]:
+    def adapt(self, notices: Iterable[Any]) -> List[CivicEvent]:
         """
         Convert PublicNotice objects to CivicEvents.
         
         Args:
-            notices: List of PublicNotice dataclass instances
+            notices: PublicNotice dataclass instances
             
         Returns:
             List of CivicEvent objects
         """
-        events = []
+        return list(self.iter_adapt(notices))
+    
+    def iter_adapt(self, notices: Iterable[Any]) -> Iterator[CivicEvent]:
+        """
+        Lazily convert PublicNotice objects to CivicEvents.
         
-        for notice in notices:
-            try:
-                event = self._convert_notice(notice)
-                if event:
-                    events.append(event)
-            except Exception as e:
-                logger.warning(
-                    "Failed to convert Florida notice",
-                    notice_id=getattr(notice, 'notice_id', 'unknown'),
-                    error=str(e)
-                )
+        Yields each event as soon as it is converted, so consumers can
+        start writing before the whole batch is built.
         
-        logger.info(
-            "Adapted Florida notices to CivicEvents",
-            input_count=len(notices),
-            output_count=len(events)
-        )
+        Args:
+            notices: PublicNotice dataclass instances (any iterable)
+            
+        Yields:
+            CivicEvent objects
+        """
+        input_count = 0
+        output_count = 0
         
-        return events
+        try:
+            for notice in notices:
+                input_count += 1
+                try:
+                    event = self._convert_notice(notice)
+                except Exception as e:
+                    logger.warning(
+                        "Failed to convert Florida notice",
+                        notice_id=getattr(notice, 'notice_id', 'unknown'),
+                        error=str(e)
+                    )
+                    continue
+                if event:
+                    output_count += 1
+                    yield event
+        finally:
+            logger.info(
+                "Adapted Florida notices to CivicEvents",
+                input_count=input_count,
+                output_count=output_count
+            )
     
-    def _convert_notice(self, notice: Any) -> Optional[CivicEvent]:
-        """Convert a single PublicNotice to CivicEvent."""
+    def _convert_notice(
+        self,
+        notice: Any,
+        raw_data: Optional[dict] = None,
+    ) -> Optional[CivicEvent]:
+        """
+        Convert a single PublicNotice (or attribute view) to CivicEvent.
+        
+        Args:
+            notice: Object exposing notice fields as attributes
+            raw_data: Raw record to store on the event (defaults to a
+                dict of the notice's source fields)
+        """
         # Extract notice attributes
-        notice_id = getattr(notice, 'notice_id', None)
-        title = getattr(notice, 'title', None)
-        newspaper = getattr(notice, 'newspaper', None)
-        county = getattr(notice, 'county', None)
-        publication_date = getattr(notice, 'publication_date', None)
-        category = getattr(notice, 'category', None)
-        keywords = getattr(notice, 'keywords', [])
-        content = getattr(notice, 'content', None)
-        pdf_url = getattr(notice, 'pdf_url', None)
-        detail_url = getattr(notice, 'detail_url', None)
+        (
+            notice_id, title, newspaper, county, publication_date,
+            category, keywords, content, pdf_url, detail_url,
+        ) = _read_notice(notice)
         
         if not notice_id:
             return None
@@ -106,12 +182,19 @@ class FloridaNoticesAdapter(BaseAdapter):
             description_parts.append(f"Keywords: {', '.join(keywords[:5])}")
         description = " | ".join(description_parts) if description_parts else None
         
-        # Extract entities from title and content
+        # Extract entities from title and content in one pass, keeping the
+        # first of any entity mentioned in both
+        head = f"{title}{_SEGMENT_SEP}"
+        if content and not content.isspace():
+            scan_text = head + content[:1000]
+        else:
+            scan_text = head
         entities = []
-        if title:
-            entities.extend(self.extract_entities_from_text(title))
-        if content:
-            entities.extend(self.extract_entities_from_text(content[:1000]))
+        seen_ids = set()
+        for entity in self.extract_entities_from_text(scan_text):
+            if entity.entity_id not in seen_ids:
+                seen_ids.add(entity.entity_id)
+                entities.append(entity)
         
         # Build location
         location = None
@@ -122,29 +205,21 @@ class FloridaNoticesAdapter(BaseAdapter):
                 county=county,
             )
         
-        # Build tags
-        tags = ["public-notice", "legal-notice"]
-        if county:
-            tags.append(county.lower().replace(" ", "-"))
-        if county and county.lower() == "alachua":
-            tags.append("alachua-county")
-        
-        # Add category as tag
-        if category:
-            tags.append(self._normalize_for_id(category))
-        
-        # Add keyword-based tags
-        if keywords:
-            for kw in keywords[:10]:
-                tag = self._normalize_for_id(kw)
-                if len(tag) > 2:
-                    tags.append(tag)
-        
-        # Extract additional tags from content
-        if title:
-            tags.extend(self.extract_tags_from_text(title))
-        if content:
-            tags.extend(self.extract_tags_from_text(content[:500]))
+        # Build tags: fixed, county, category, keyword-based, then tags
+        # extracted from title and content[:500] (a prefix of the entity
+        # scan text), gathered into one list
+        keyword_tags = (
+            [tag for tag in map(self._normalize_for_id, keywords[:10]) if len(tag) > 2]
+            if keywords else ()
+        )
+        tags = [
+            "public-notice",
+            "legal-notice",
+            *self._county_tags(county),
+            *((self._normalize_for_id(category),) if category else ()),
+            *keyword_tags,
+            *self.extract_tags_from_text(scan_text[:len(head) + 500]),
+        ]
         
         # Build documents
         documents = []
@@ -167,8 +242,8 @@ class FloridaNoticesAdapter(BaseAdapter):
             location=location,
             entities=entities,
             documents=documents,
-            tags=list(set(tags)),
-            raw_data={
+            tags=list(dict.fromkeys(tags)),  # dedupe, keep order
+            raw_data=raw_data if raw_data is not None else {
                 "notice_id": notice_id,
                 "newspaper": newspaper,
                 "county": county,
@@ -190,17 +265,9 @@ class FloridaNoticesAdapter(BaseAdapter):
             return date
         
         if isinstance(date, str):
-            formats = [
-                "%Y-%m-%d",
-                "%m/%d/%Y",
-                "%B %d, %Y",
-                "%b %d, %Y",
-            ]
-            for fmt in formats:
-                try:
-                    return datetime.strptime(date, fmt)
-                except ValueError:
-                    continue
+            parsed = _parse_date_string(date)
+            if parsed is not None:
+                return parsed
         
         return datetime.now()
     
@@ -230,51 +297,16 @@ class FloridaNoticesAdapter(BaseAdapter):
         return events
     
     def _convert_notice_dict(self, notice: dict) -> Optional[CivicEvent]:
-        """Convert a notice dictionary to CivicEvent."""
+        """
+        Convert a notice dictionary to CivicEvent.
+        
+        Shares _convert_notice() via an attribute view of the dict, so dict
+        input gets the same description, category/keyword tags and content
+        scan. The original dict is kept as raw_data.
+        """
         notice_id = notice.get('notice_id') or notice.get('id')
         if not notice_id:
             return None
         
-        title = notice.get('title', 'Public Notice')
-        county = notice.get('county')
-        publication_date = notice.get('publication_date')
-        
-        event_id = f"florida-notice-{notice_id}"
-        timestamp = self._parse_date(publication_date)
-        
-        entities = self.extract_entities_from_text(title)
-        
-        tags = ["public-notice", "legal-notice"]
-        if county:
-            tags.append(county.lower().replace(" ", "-"))
-        tags.extend(self.extract_tags_from_text(title))
-        
-        documents = []
-        if notice.get('pdf_url'):
-            documents.append(Document(
-                document_id=f"pdf-{notice_id}",
-                title=f"Notice PDF",
-                url=notice['pdf_url'],
-                document_type="pdf",
-            ))
-        
-        location = None
-        if county:
-            location = GeoLocation(
-                latitude=0.0,
-                longitude=0.0,
-                county=county,
-            )
-        
-        return CivicEvent(
-            event_id=event_id,
-            event_type=EventType.PUBLIC_NOTICE,
-            source_id=self.source_id,
-            timestamp=timestamp,
-            title=title,
-            location=location,
-            entities=entities,
-            documents=documents,
-            tags=list(set(tags)),
-            raw_data=notice,
-        )
+        view = SimpleNamespace(**{**notice, 'notice_id': notice_id})
+        return self._convert_notice(view, raw_data=notice)
@@ -5,7 +5,9 @@ Transforms PermitNotice and PermitDetail objects into the unified CivicEvent mod
 """
 
 from datetime import datetime
-from typing import List, Optional, Any
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Iterable, Iterator, List, Optional
 
 from src.intelligence.models import (
     CivicEvent,
@@ -15,11 +17,35 @@ from src.intelligence.models import (
     Document,
     GeoLocation,
 )
-from src.intelligence.adapters.base_adapter import BaseAdapter
+from src.intelligence.adapters.base_adapter import BaseAdapter, fields_getter
 from src.logging_config import get_logger
 
 logger = get_logger("intelligence.adapters.srwmd")
 
+# PermitNotice attributes read by _convert_notice (missing ones read as None)
+_read_notice = fields_getter(
+    "notice_id", "notice_type", "permit_number", "project_name", "county",
+    "rule_type", "permit_type", "date", "permit_url",
+)
+
+# Rule-type substring -> permit tag, in output order
+_RULE_TAGS = (
+    ("erp", "erp"),
+    ("general", "general-permit"),
+    ("individual", "individual-permit"),
+)
+
+
+@lru_cache(maxsize=256)
+def _rule_tags(rule_type: str) -> tuple[str, ...]:
+    """
+    Return the permit tags for a rule type.
+
+    Memoized: SRWMD uses a small, fixed set of rule type labels.
+    """
+    rule_lower = rule_type.lower()
+    return tuple(tag for keyword, tag in _RULE_TAGS if keyword in rule_lower)
+
 
 class SRWMDAdapter(BaseAdapter):
     """
@@ -37,56 +63,69 @@ class SRWMDAdapter(BaseAdapter):
     def source_id(self) -> str:
         return self._source_id
     
-    def adapt(self, notices: List[Any]) -> List[CivicEvent]:
+    def adapt(self, notices: Iterable[Any]) -> List[CivicEvent]:
         """
         Convert PermitNotice objects to CivicEvents.
         
         Args:
-            notices: List of PermitNotice dataclass instances
+            notices: PermitNotice dataclass instances
             
         Returns:
             List of CivicEvent objects
         """
-        events = []
+        return list(self.iter_adapt(notices))
+    
+    def iter_adapt(self, notices: Iterable[Any]) -> Iterator[CivicEvent]:
+        """
+        Lazily convert PermitNotice objects to CivicEvents.
         
-        for notice in notices:
-            try:
-                event = self._convert_notice(notice)
-                if event:
-                    events.append(event)
-            except Exception as e:
-                logger.warning(
-                    "Failed to convert SRWMD notice",
-                    notice_id=getattr(notice, 'notice_id', 'unknown'),
-                    error=str(e)
-                )
+        Yields each event as soon as it is converted, so consumers can
+        start writing before the whole batch is built.
         
-        logger.info(
-            "Adapted SRWMD notices to CivicEvents",
-            input_count=len(notices),
-            output_count=len(events)
-        )
+        Args:
+            notices: PermitNotice dataclass instances (any iterable)
+            
+        Yields:
+            CivicEvent objects
+        """
+        input_count = 0
+        output_count = 0
         
-        return events
+        try:
+            for notice in notices:
+                input_count += 1
+                try:
+                    event = self._convert_notice(notice)
+                except Exception as e:
+                    logger.warning(
+                        "Failed to convert SRWMD notice",
+                        notice_id=getattr(notice, 'notice_id', 'unknown'),
+                        error=str(e)
+                    )
+                    continue
+                if event:
+                    output_count += 1
+                    yield event
+        finally:
+            logger.info(
+                "Adapted SRWMD notices to CivicEvents",
+                input_count=input_count,
+                output_count=output_count
+            )
     
     def _convert_notice(self, notice: Any) -> Optional[CivicEvent]:
         """Convert a single PermitNotice to CivicEvent."""
         # Extract notice attributes
-        notice_id = getattr(notice, 'notice_id', None)
-        notice_type = getattr(notice, 'notice_type', None)
-        permit_number = getattr(notice, 'permit_number', None)
-        project_name = getattr(notice, 'project_name', None)
-        county = getattr(notice, 'county', None)
-        rule_type = getattr(notice, 'rule_type', None)
-        permit_type = getattr(notice, 'permit_type', None)
-        date = getattr(notice, 'date', None)
-        permit_url = getattr(notice, 'permit_url', None)
+        (
+            notice_id, notice_type, permit_number, project_name, county,
+            rule_type, permit_type, date, permit_url,
+        ) = _read_notice(notice)
         
         if not notice_id or not permit_number:
             return None
         
         # Determine event type based on notice type
-        notice_type_value = notice_type.value if hasattr(notice_type, 'value') else str(notice_type)
+        notice_type_value = notice_type.value if isinstance(notice_type, Enum) else str(notice_type)
         if "issuance" in notice_type_value.lower():
             event_type = EventType.PERMIT_ISSUED
             source_suffix = "issuances"
@@ -110,21 +149,22 @@ class SRWMDAdapter(BaseAdapter):
         if county:
             description_parts.append(f"County: {county}")
         if permit_type:
-            permit_type_value = permit_type.value if hasattr(permit_type, 'value') else str(permit_type)
+            permit_type_value = permit_type.value if isinstance(permit_type, Enum) else str(permit_type)
             description_parts.append(f"Permit Type: {permit_type_value}")
         description = " | ".join(description_parts) if description_parts else None
         
-        # Extract entities
+        # Extract entities, plus the project itself as an entity
         entities = []
         if project_name:
-            entities.extend(self.extract_entities_from_text(project_name))
-            # Add project as entity
-            entities.append(Entity(
-                entity_id=f"project-{self._normalize_for_id(project_name)}",
-                entity_type=EntityType.PROJECT,
-                name=project_name,
-                metadata={"permit_number": permit_number},
-            ))
+            entities = [
+                *self.extract_entities_from_text(project_name),
+                Entity(
+                    entity_id=f"project-{self._normalize_for_id(project_name)}",
+                    entity_type=EntityType.PROJECT,
+                    name=project_name,
+                    metadata={"permit_number": permit_number},
+                ),
+            ]
         
         # Build location
         location = None
@@ -135,26 +175,16 @@ class SRWMDAdapter(BaseAdapter):
                 county=county,
             )
         
-        # Extract tags
-        tags = ["permit", "srwmd", "water"]
-        if county:
-            tags.append(county.lower().replace(" ", "-"))
-        if county and county.lower() == "alachua":
-            tags.append("alachua-county")
-        
-        # Add permit type tags
-        if rule_type:
-            rule_lower = rule_type.lower()
-            if "erp" in rule_lower:
-                tags.append("erp")
-            if "general" in rule_lower:
-                tags.append("general-permit")
-            if "individual" in rule_lower:
-                tags.append("individual-permit")
-        
-        # Add environmental tags based on project name
-        if project_name:
-            tags.extend(self.extract_tags_from_text(project_name))
+        # Extract tags: fixed, county, permit type, then environmental
+        # tags based on project name
+        tags = [
+            "permit",
+            "srwmd",
+            "water",
+            *self._county_tags(county),
+            *(_rule_tags(rule_type) if rule_type else ()),
+            *self.extract_tags_from_text(project_name),
+        ]
         
         # Build documents
         documents = []
@@ -177,7 +207,7 @@ class SRWMDAdapter(BaseAdapter):
             location=location,
             entities=entities,
             documents=documents,
-            tags=list(set(tags)),
+            tags=list(dict.fromkeys(tags)),  # dedupe, keep order
             raw_data={
                 "notice_id": notice_id,
                 "permit_number": permit_number,
@@ -5,17 +5,64 @@ Provides storage, retrieval, and query capabilities for the unified
 event model, enabling "what's new" queries and change detection.
 """
 
-import json
+import functools
 import os
+import threading
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
 from datetime import datetime, timedelta
+from operator import itemgetter
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Callable
+from typing import Optional, List, Dict, Any, Callable, Iterable, NamedTuple, Set, Tuple
 
 from src.intelligence.models import CivicEvent, EventType, AlertSeverity
+from src.intelligence.serialization import dumps, loads
 from src.logging_config import get_logger
 
 logger = get_logger("intelligence.event_store")
 
+# The change log is compacted into the snapshot once it holds more than
+# COMPACT_LOG_RATIO entries per live event (and at least COMPACT_MIN_LOG_ENTRIES)
+COMPACT_LOG_RATIO = 2
+COMPACT_MIN_LOG_ENTRIES = 100
+
+# Rows per Supabase upsert request when dual-writing a batch of events
+SUPABASE_UPSERT_BATCH_SIZE = 500
+
+# Shared empty result for index lookups that miss
+_NO_IDS: frozenset = frozenset()
+
+# Sort key for the (datetime, event_id) time indexes
+_time_key = itemgetter(0)
+
+# Gram length for the entity-name substring index
+NAME_GRAM_SIZE = 3
+
+
+def _name_grams(text: str) -> Set[str]:
+    """Distinct NAME_GRAM_SIZE-character substrings of text."""
+    return {text[i:i + NAME_GRAM_SIZE] for i in range(len(text) - NAME_GRAM_SIZE + 1)}
+
+
+def _locked(method: Callable) -> Callable:
+    """Run an EventStore method while holding the store's lock."""
+    @functools.wraps(method)
+    def wrapper(self: "EventStore", *args: Any, **kwargs: Any) -> Any:
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+class _IndexKeys(NamedTuple):
+    """Index keys an event was filed under, so it can be unfiled exactly."""
+    source_id: str
+    event_type: str
+    tags: Tuple[str, ...]
+    county: Optional[str]
+    entity_names: Tuple[str, ...]
+    timestamp: Tuple[datetime, str]
+    discovered_at: Tuple[datetime, str]
+
 
 class EventStore:
     """
@@ -30,6 +77,17 @@ class EventStore:
     - Query events by time range, source, tags
     - Detect new vs updated events
     - "What's new" queries
+
+    Queries are served from in-memory secondary indexes (source, type,
+    tag, county, entity name, and sorted timestamp/discovered_at lists)
+    that save/delete keep in step with _events.
+
+    On disk, events.json is a snapshot and events.jsonl an append-only
+    change log replayed over it on load. Saves and deletes append one
+    line; compact() folds the log back into the snapshot.
+
+    Thread-safe: one lock guards _events, the indexes and the log.
+    Supabase writes happen after it is released.
     """
 
     def __init__(self, storage_path: Optional[str] = None, enable_supabase: bool = True):
@@ -60,15 +118,20 @@ class EventStore:
                 logger.info("Migrated events.json from config/ to data/state/")
 
         self.storage_path = Path(storage_path)
+        self.log_path = self.storage_path.with_suffix(".jsonl")
+        self._lock = threading.RLock()
+        self._log_fp = None
+        self._log_entries = 0
         self._events: Dict[str, CivicEvent] = {}
         self._load()
+        self._replay_log()
+        self._rebuild_indexes()
 
     def _load(self) -> None:
         """Load events from storage file."""
         if self.storage_path.exists():
             try:
-                with open(self.storage_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                data = loads(self.storage_path.read_bytes())
 
                 for event_data in data.get("events", []):
                     try:
@@ -92,6 +155,187 @@ class EventStore:
         else:
             logger.debug("No existing event store found, starting fresh")
 
+    def _replay_log(self) -> None:
+        """Apply changes logged since the last snapshot."""
+        if not self.log_path.exists():
+            return
+
+        try:
+            with open(self.log_path, 'rb') as f:
+                for line_no, line in enumerate(f, 1):
+                    if not line.strip():
+                        continue
+                    try:
+                        entry = loads(line)
+                        if entry["op"] == "put":
+                            event = CivicEvent.from_dict(entry["event"])
+                            self._events[event.event_id] = event
+                        elif entry["op"] == "del":
+                            self._events.pop(entry["event_id"], None)
+                    except Exception as e:
+                        # e.g. a torn last line from a crash mid-append
+                        logger.warning("Skipping unreadable event log entry", line=line_no, error=str(e))
+                        continue
+                    self._log_entries += 1
+
+            logger.debug(
+                "Replayed event log",
+                entries=self._log_entries,
+                count=len(self._events),
+                path=str(self.log_path)
+            )
+        except Exception as e:
+            logger.error("Failed to replay event log", error=str(e))
+
+    # ------------------------------------------------------------------
+    # Secondary indexes
+    # ------------------------------------------------------------------
+
+    def _rebuild_indexes(self) -> None:
+        """Build all secondary indexes from _events."""
+        self._indexed: Dict[str, _IndexKeys] = {}
+        self._by_source: Dict[str, Set[str]] = defaultdict(set)
+        self._by_type: Dict[str, Set[str]] = defaultdict(set)
+        self._by_tag: Dict[str, Set[str]] = defaultdict(set)
+        self._by_county: Dict[str, Set[str]] = defaultdict(set)
+        self._by_entity_name: Dict[str, Set[str]] = defaultdict(set)
+        # Trigram -> entity names containing it (narrows substring lookups)
+        self._name_grams: Dict[str, Set[str]] = defaultdict(set)
+        # (datetime, event_id) pairs, kept sorted for range queries
+        self._by_timestamp: List[Tuple[datetime, str]] = []
+        self._by_discovered: List[Tuple[datetime, str]] = []
+
+        for event in self._events.values():
+            self._index_event(event, keep_sorted=False)
+        self._by_timestamp.sort()
+        self._by_discovered.sort()
+
+    def _index_event(self, event: CivicEvent, keep_sorted: bool = True) -> None:
+        """File an event under each secondary index."""
+        event_id = event.event_id
+        county = event.location.county if event.location else None
+        keys = _IndexKeys(
+            source_id=event.source_id,
+            event_type=event.event_type.value,
+            tags=tuple(set(event.tags)),
+            county=county.lower() if county else None,
+            entity_names=tuple({e.normalized_name for e in event.entities if e.normalized_name}),
+            timestamp=(event.timestamp, event_id),
+            discovered_at=(event.discovered_at, event_id),
+        )
+        self._indexed[event_id] = keys
+
+        self._by_source[keys.source_id].add(event_id)
+        self._by_type[keys.event_type].add(event_id)
+        for tag in keys.tags:
+            self._by_tag[tag].add(event_id)
+        if keys.county:
+            self._by_county[keys.county].add(event_id)
+        for name in keys.entity_names:
+            if name not in self._by_entity_name:
+                for gram in _name_grams(name):
+                    self._name_grams[gram].add(name)
+            self._by_entity_name[name].add(event_id)
+
+        if keep_sorted:
+            self._by_timestamp.insert(bisect_right(self._by_timestamp, keys.timestamp), keys.timestamp)
+            self._by_discovered.insert(bisect_right(self._by_discovered, keys.discovered_at), keys.discovered_at)
+        else:
+            self._by_timestamp.append(keys.timestamp)
+            self._by_discovered.append(keys.discovered_at)
+
+    def _unindex_event(self, event_id: str) -> None:
+        """Remove an event from every secondary index it was filed under."""
+        keys = self._indexed.pop(event_id, None)
+        if keys is None:
+            return
+
+        def discard(index: Dict[Any, Set[str]], key: Any, member: str = event_id) -> None:
+            members = index.get(key)
+            if members is not None:
+                members.discard(member)
+                if not members:
+                    del index[key]
+
+        discard(self._by_source, keys.source_id)
+        discard(self._by_type, keys.event_type)
+        for tag in keys.tags:
+            discard(self._by_tag, tag)
+        if keys.county:
+            discard(self._by_county, keys.county)
+        for name in keys.entity_names:
+            discard(self._by_entity_name, name)
+            if name not in self._by_entity_name:
+                for gram in _name_grams(name):
+                    discard(self._name_grams, gram, name)
+
+        for sorted_ids, entry in (
+            (self._by_timestamp, keys.timestamp),
+            (self._by_discovered, keys.discovered_at),
+        ):
+            i = bisect_left(sorted_ids, entry)
+            if i < len(sorted_ids) and sorted_ids[i] == entry:
+                del sorted_ids[i]
+
+    def _matching_ids(
+        self,
+        source_id: Optional[str] = None,
+        event_type: Optional[EventType] = None,
+        tags: Optional[List[str]] = None,
+    ) -> Optional[Set[str]]:
+        """
+        Intersect the index entries for the given filters.
+
+        Returns None when no filter is given (every event matches).
+        """
+        candidates = []
+        if source_id:
+            candidates.append(self._by_source.get(source_id, _NO_IDS))
+        if event_type:
+            type_key = event_type.value if isinstance(event_type, EventType) else event_type
+            candidates.append(self._by_type.get(type_key, _NO_IDS))
+        if tags:
+            candidates.extend(self._by_tag.get(tag.lower(), _NO_IDS) for tag in tags)
+
+        if not candidates:
+            return None
+
+        # Smallest set first keeps the intersection cheap
+        candidates.sort(key=len)
+        return set(candidates[0]).intersection(*candidates[1:])
+
+    def _in_time_range(
+        self,
+        sorted_ids: List[Tuple[datetime, str]],
+        start: Optional[datetime],
+        end: Optional[datetime],
+        ids: Optional[Set[str]],
+        newest_first: bool = True,
+        limit: Optional[int] = None,
+    ) -> List[CivicEvent]:
+        """
+        Walk a time index between start and end (inclusive), keeping events
+        whose IDs are in ids (or all events when ids is None).
+        """
+        lo = bisect_left(sorted_ids, start, key=_time_key) if start else 0
+        hi = bisect_right(sorted_ids, end, key=_time_key) if end else len(sorted_ids)
+        positions = range(hi - 1, lo - 1, -1) if newest_first else range(lo, hi)
+
+        results = []
+        for i in positions:
+            event_id = sorted_ids[i][1]
+            if ids is None or event_id in ids:
+                results.append(self._events[event_id])
+                if limit and len(results) >= limit:
+                    break
+        return results
+
+    def _newest_first(self, ids: Iterable[str]) -> List[CivicEvent]:
+        """Fetch events by ID, sorted by timestamp descending."""
+        results = [self._events[event_id] for event_id in ids]
+        results.sort(key=lambda e: e.timestamp, reverse=True)
+        return results
+
     def _init_supabase(self) -> None:
         """Attempt to connect to Supabase for dual-write."""
         try:
@@ -106,8 +350,73 @@ class EventStore:
             logger.warning("EventStore Supabase unavailable, file-only mode", error=str(e))
             self._supabase_available = False
 
-    def _save(self) -> None:
-        """Save events to storage file."""
+    def _append_log(self, entries: List[Dict[str, Any]]) -> None:
+        """
+        Append changes to the log in a single write.
+
+        Lines are flushed to the OS but not fsynced; flush() marks a
+        durability boundary. Compacts once the log outgrows the live set.
+        """
+        if not entries:
+            return
+        try:
+            if self._log_fp is None:
+                self.log_path.parent.mkdir(parents=True, exist_ok=True)
+                torn_tail = self._log_has_torn_tail()
+                self._log_fp = open(self.log_path, 'ab')
+                if torn_tail:
+                    # Keep the next entry off a partial line left by a crash
+                    self._log_fp.write(b"\n")
+            self._log_fp.write(b"".join(dumps(entry) + b"\n" for entry in entries))
+            self._log_fp.flush()
+            self._log_entries += len(entries)
+        except Exception as e:
+            logger.error("Failed to append to event log", error=str(e))
+            return
+
+        if (
+            self._log_entries >= COMPACT_MIN_LOG_ENTRIES
+            and self._log_entries > COMPACT_LOG_RATIO * len(self._events)
+        ):
+            self.compact()
+
+    def _log_has_torn_tail(self) -> bool:
+        """Check whether the log ends mid-line."""
+        try:
+            with open(self.log_path, 'rb') as f:
+                f.seek(0, os.SEEK_END)
+                if f.tell() == 0:
+                    return False
+                f.seek(-1, os.SEEK_END)
+                return f.read(1) != b"\n"
+        except FileNotFoundError:
+            return False
+
+    def _close_log(self) -> None:
+        """Close the change log file handle, if open."""
+        if self._log_fp is not None:
+            self._log_fp.close()
+            self._log_fp = None
+
+    @_locked
+    def flush(self) -> None:
+        """fsync the change log so logged changes survive a crash."""
+        if self._log_fp is None:
+            return
+        try:
+            self._log_fp.flush()
+            os.fsync(self._log_fp.fileno())
+        except Exception as e:
+            logger.error("Failed to flush event log", error=str(e))
+
+    @_locked
+    def compact(self) -> None:
+        """
+        Rewrite the snapshot from memory and truncate the change log.
+
+        The snapshot is replaced atomically before the log is removed;
+        replaying a leftover log over the new snapshot is a no-op.
+        """
         try:
             self.storage_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -117,42 +426,64 @@ class EventStore:
                 "events": [e.to_dict() for e in self._events.values()]
             }
 
-            with open(self.storage_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, default=str)
+            tmp_path = self.storage_path.with_name(self.storage_path.name + ".tmp")
+            with open(tmp_path, 'wb') as f:
+                f.write(dumps(data, indent=True))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.storage_path)
+
+            self._close_log()
+            self.log_path.unlink(missing_ok=True)
+            self._log_entries = 0
 
             logger.debug("Saved events to storage", count=len(self._events))
         except Exception as e:
             logger.error("Failed to save event store", error=str(e))
 
-    def _save_event_to_supabase(self, event: CivicEvent) -> None:
-        """Write a single event to Supabase (non-blocking on failure)."""
-        if not self._supabase_available or not self._supabase:
+    @_locked
+    def close(self) -> None:
+        """Flush and close the change log."""
+        self.flush()
+        self._close_log()
+
+    @staticmethod
+    def _supabase_payload(event: CivicEvent) -> Dict[str, Any]:
+        """Build the civic_events row for an event."""
+        return {
+            "event_id": event.event_id,
+            "event_type": event.event_type.value,
+            "source_id": event.source_id,
+            "timestamp": event.timestamp.isoformat(),
+            "discovered_at": event.discovered_at.isoformat(),
+            "updated_at": event.updated_at.isoformat(),
+            "title": event.title,
+            "description": event.description,
+            "content_hash": event.content_hash,
+            "tags": event.tags,
+            "location": event.location.to_dict() if event.location else None,
+            "entities": [e.to_dict() for e in event.entities],
+            "documents": [d.to_dict() for d in event.documents],
+            "raw_data": event.raw_data,
+            "metadata": event.metadata,
+        }
+
+    def _save_events_to_supabase(self, events: List[CivicEvent]) -> None:
+        """Upsert events to Supabase in batches (non-blocking on failure)."""
+        if not events or not self._supabase_available or not self._supabase:
             return
-        try:
-            payload = {
-                "event_id": event.event_id,
-                "event_type": event.event_type.value,
-                "source_id": event.source_id,
-                "timestamp": event.timestamp.isoformat(),
-                "discovered_at": event.discovered_at.isoformat(),
-                "updated_at": event.updated_at.isoformat(),
-                "title": event.title,
-                "description": event.description,
-                "content_hash": event.content_hash,
-                "tags": event.tags,
-                "location": event.location.to_dict() if event.location else None,
-                "entities": [e.to_dict() for e in event.entities],
-                "documents": [d.to_dict() for d in event.documents],
-                "raw_data": event.raw_data,
-                "metadata": event.metadata,
-            }
-            self._supabase.table("civic_events").upsert(payload).execute()
-        except Exception as e:
-            logger.warning(
-                "Supabase dual-write failed (non-blocking)",
-                event_id=event.event_id,
-                error=str(e)
-            )
+        for start in range(0, len(events), SUPABASE_UPSERT_BATCH_SIZE):
+            batch = events[start:start + SUPABASE_UPSERT_BATCH_SIZE]
+            try:
+                payload = [self._supabase_payload(event) for event in batch]
+                self._supabase.table("civic_events").upsert(payload).execute()
+            except Exception as e:
+                logger.warning(
+                    "Supabase dual-write failed (non-blocking)",
+                    event_ids=[event.event_id for event in batch[:5]],
+                    count=len(batch),
+                    error=str(e)
+                )
 
     def _delete_event_from_supabase(self, event_id: str) -> None:
         """Delete an event from Supabase (non-blocking on failure)."""
@@ -175,38 +506,49 @@ class EventStore:
             - is_new: True if event is new, False if updated
             - status: "new", "updated", or "unchanged"
         """
+        with self._lock:
+            status = self._apply_event(event)
+            if status != "unchanged":
+                self._append_log([{"op": "put", "event": event.to_dict()}])
+
+        if status != "unchanged":
+            self._save_events_to_supabase([event])
+        return status == "new", status
+
+    def _apply_event(self, event: CivicEvent) -> str:
+        """
+        Store and index an event in memory (caller holds the lock and
+        writes the log). Returns "new", "updated" or "unchanged".
+        """
         existing = self._events.get(event.event_id)
 
-        if existing is None:
-            # New event
-            self._events[event.event_id] = event
-            self._save()
-            self._save_event_to_supabase(event)
-            logger.info(
-                "Saved new event",
-                event_id=event.event_id,
-                event_type=event.event_type.value
-            )
-            return True, "new"
+        if existing is not None:
+            if not event.has_changed(existing):
+                return "unchanged"
 
-        elif event.has_changed(existing):
             # Updated event
             event.discovered_at = existing.discovered_at  # Preserve original discovery
             event.updated_at = datetime.now()
-            self._events[event.event_id] = event
-            self._save()
-            self._save_event_to_supabase(event)
+            self._unindex_event(event.event_id)
+
+        self._events[event.event_id] = event
+        self._index_event(event)
+
+        if existing is None:
             logger.info(
-                "Updated existing event",
+                "Saved new event",
                 event_id=event.event_id,
-                old_hash=existing.content_hash,
-                new_hash=event.content_hash
+                event_type=event.event_type.value
             )
-            return False, "updated"
+            return "new"
 
-        else:
-            # Unchanged
-            return False, "unchanged"
+        logger.info(
+            "Updated existing event",
+            event_id=event.event_id,
+            old_hash=existing.content_hash,
+            new_hash=event.content_hash
+        )
+        return "updated"
 
     def save_events(self, events: List[CivicEvent]) -> Dict[str, int]:
         """
@@ -219,10 +561,20 @@ class EventStore:
             Dict with counts: {"new": N, "updated": N, "unchanged": N}
         """
         counts = {"new": 0, "updated": 0, "unchanged": 0}
+        changed = []
+
+        with self._lock:
+            for event in events:
+                status = self._apply_event(event)
+                counts[status] += 1
+                if status != "unchanged":
+                    changed.append(event)
 
-        for event in events:
-            _, status = self.save_event(event)
-            counts[status] += 1
+            # One log write and one durability boundary per batch
+            self._append_log([{"op": "put", "event": event.to_dict()} for event in changed])
+            self.flush()
+
+        self._save_events_to_supabase(changed)
 
         logger.info(
             "Batch saved events",
@@ -245,6 +597,7 @@ class EventStore:
         """
         return self._events.get(event_id)
 
+    @_locked
     def get_events(
         self,
         source_id: Optional[str] = None,
@@ -267,34 +620,15 @@ class EventStore:
 
         Returns:
             List of matching CivicEvents, sorted by timestamp descending
+            (ties broken by event ID)
         """
-        results = list(self._events.values())
+        ids = self._matching_ids(source_id, event_type, tags)
+        if ids is not None and not ids:
+            return []
 
-        # Apply filters
-        if source_id:
-            results = [e for e in results if e.source_id == source_id]
-
-        if event_type:
-            results = [e for e in results if e.event_type == event_type]
-
-        if tags:
-            results = [e for e in results if e.matches_tags(tags)]
-
-        if since:
-            results = [e for e in results if e.timestamp >= since]
-
-        if until:
-            results = [e for e in results if e.timestamp <= until]
-
-        # Sort by timestamp descending (newest first)
-        results.sort(key=lambda e: e.timestamp, reverse=True)
-
-        # Apply limit
-        if limit:
-            results = results[:limit]
-
-        return results
+        return self._in_time_range(self._by_timestamp, since, until, ids, limit=limit)
 
+    @_locked
     def get_whats_new(
         self,
         hours: int = 24,
@@ -316,21 +650,14 @@ class EventStore:
         """
         cutoff = datetime.now() - timedelta(hours=hours)
 
-        results = [
-            e for e in self._events.values()
-            if e.discovered_at >= cutoff
-        ]
-
-        if source_id:
-            results = [e for e in results if e.source_id == source_id]
-
+        ids = self._matching_ids(source_id=source_id)
         if tags:
-            results = [e for e in results if e.matches_any_tag(tags)]
-
-        results.sort(key=lambda e: e.discovered_at, reverse=True)
+            any_tag = set().union(*(self._by_tag.get(tag.lower(), _NO_IDS) for tag in tags))
+            ids = any_tag if ids is None else ids & any_tag
 
-        return results
+        return self._in_time_range(self._by_discovered, cutoff, None, ids)
 
+    @_locked
     def get_upcoming(
         self,
         days: int = 7,
@@ -349,18 +676,10 @@ class EventStore:
         now = datetime.now()
         cutoff = now + timedelta(days=days)
 
-        results = [
-            e for e in self._events.values()
-            if now <= e.timestamp <= cutoff
-        ]
-
-        if event_type:
-            results = [e for e in results if e.event_type == event_type]
-
-        results.sort(key=lambda e: e.timestamp)
-
-        return results
+        ids = self._matching_ids(event_type=event_type)
+        return self._in_time_range(self._by_timestamp, now, cutoff, ids, newest_first=False)
 
+    @_locked
     def get_by_entity(self, entity_name: str) -> List[CivicEvent]:
         """
         Find events mentioning a specific entity.
@@ -373,16 +692,24 @@ class EventStore:
         """
         normalized = entity_name.lower().strip()
 
-        results = []
-        for event in self._events.values():
-            for entity in event.entities:
-                if normalized in entity.normalized_name:
-                    results.append(event)
-                    break
+        # Substring match over distinct entity names, not every event.
+        # Names containing the query contain all of its trigrams, so the
+        # trigram index narrows the candidates before the exact check.
+        grams = _name_grams(normalized)
+        if grams:
+            gram_sets = sorted((self._name_grams.get(g, _NO_IDS) for g in grams), key=len)
+            candidates = set(gram_sets[0]).intersection(*gram_sets[1:])
+        else:
+            candidates = self._by_entity_name.keys()
 
-        results.sort(key=lambda e: e.timestamp, reverse=True)
-        return results
+        ids = set()
+        for name in candidates:
+            if normalized in name:
+                ids |= self._by_entity_name[name]
 
+        return self._newest_first(ids)
+
+    @_locked
     def get_by_county(self, county: str) -> List[CivicEvent]:
         """
         Find events in a specific county.
@@ -396,21 +723,16 @@ class EventStore:
         county_lower = county.lower()
         county_tag = county_lower.replace(" ", "-")
 
-        results = []
-        for event in self._events.values():
-            # Check location
-            if event.location and event.location.county:
-                if event.location.county.lower() == county_lower:
-                    results.append(event)
-                    continue
-
-            # Check tags
-            if county_tag in event.tags or f"{county_tag}-county" in event.tags:
-                results.append(event)
+        # Location county, or either county tag
+        ids = (
+            self._by_county.get(county_lower, _NO_IDS)
+            | self._by_tag.get(county_tag, _NO_IDS)
+            | self._by_tag.get(f"{county_tag}-county", _NO_IDS)
+        )
 
-        results.sort(key=lambda e: e.timestamp, reverse=True)
-        return results
+        return self._newest_first(ids)
 
+    @_locked
     def count_events(
         self,
         source_id: Optional[str] = None,
@@ -426,25 +748,18 @@ class EventStore:
         Returns:
             Number of matching events
         """
-        count = 0
-        for event in self._events.values():
-            if source_id and event.source_id != source_id:
-                continue
-            if event_type and event.event_type != event_type:
-                continue
-            count += 1
-        return count
+        ids = self._matching_ids(source_id, event_type)
+        return len(self._events) if ids is None else len(ids)
 
+    @_locked
     def get_sources(self) -> List[str]:
         """Get list of unique source IDs in the store."""
-        return list(set(e.source_id for e in self._events.values()))
+        return list(self._by_source)
 
+    @_locked
     def get_all_tags(self) -> List[str]:
         """Get list of all unique tags across events."""
-        tags = set()
-        for event in self._events.values():
-            tags.update(event.tags)
-        return sorted(tags)
+        return sorted(self._by_tag)
 
     def delete_event(self, event_id: str) -> bool:
         """
@@ -456,17 +771,22 @@ class EventStore:
         Returns:
             True if deleted, False if not found
         """
-        if event_id in self._events:
+        with self._lock:
+            if event_id not in self._events:
+                return False
             del self._events[event_id]
-            self._save()
-            self._delete_event_from_supabase(event_id)
-            return True
-        return False
+            self._unindex_event(event_id)
+            self._append_log([{"op": "del", "event_id": event_id}])
+
+        self._delete_event_from_supabase(event_id)
+        return True
 
+    @_locked
     def clear(self) -> None:
         """Clear all events from the store."""
         self._events = {}
-        self._save()
+        self._rebuild_indexes()
+        self.compact()
         logger.info("Cleared event store")
 
     def __len__(self) -> int:
@@ -477,8 +797,6 @@ class EventStore:
 
 
 # Singleton instance
-import threading
-
 _event_store: Optional[EventStore] = None
 _event_store_lock = threading.Lock()
 
@@ -5,17 +5,24 @@ Provides health tracking for scrapers with:
 - Success/failure recording
 - Health status computation (healthy/degraded/failing)
 - Automatic retry with exponential backoff
-- JSON persistence for survival across restarts
+- JSON persistence for survival across restarts (snapshot + attempt log)
 - Alert generation for degraded scrapers
 
 Configuration:
-- HEALTH_FILE: Path to health persistence file (default: config/scraper_health.json)
+- HEALTH_FILE: Path to health persistence file (default: config/scraper_health.json);
+  a path ending in .gz stores the snapshot gzip-compressed
 - HEALTH_WINDOW_HOURS: Hours to consider for success rate (default: 24)
 - HEALTH_WINDOW_ATTEMPTS: Max attempts to consider (default: 20)
+- SAVE_DEBOUNCE_SECONDS: Delay before the snapshot is rewritten (default: 5)
+- COMPACT_LOG_ENTRIES: Logged changes that force an early rewrite (default: 500)
 """
 
-import json
+import atexit
+import gzip
+import os
+import threading
 import time
+import weakref
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, timedelta
 from enum import Enum
@@ -23,6 +30,7 @@ from pathlib import Path
 from typing import Any, Optional, Callable, TypeVar
 import functools
 
+from src.intelligence.serialization import dumps, loads
 from src.logging_config import get_logger
 
 logger = get_logger("intelligence.health")
@@ -36,6 +44,15 @@ DEFAULT_HEALTH_FILE = Path("data/state/scraper_health.json")
 HEALTH_WINDOW_HOURS = 24
 HEALTH_WINDOW_ATTEMPTS = 20
 
+# Seconds to coalesce logged attempts before rewriting the snapshot
+SAVE_DEBOUNCE_SECONDS = 5.0
+
+# Logged changes that trigger a snapshot rewrite before the debounce fires
+COMPACT_LOG_ENTRIES = 500
+
+# gzip level for .gz health files; level 1 gets most of the size win cheaply
+GZIP_COMPRESSLEVEL = 1
+
 # Health thresholds
 HEALTHY_SUCCESS_RATE = 0.90  # 90%+ = healthy
 DEGRADED_SUCCESS_RATE = 0.50  # 50-90% = degraded, <50% = failing
@@ -60,11 +77,23 @@ class HealthStatus(str, Enum):
     UNKNOWN = "unknown"  # No data yet
 
 
+# Severity order used to tell degradations from recoveries
+STATUS_ORDER = {
+    HealthStatus.HEALTHY: 0,
+    HealthStatus.DEGRADED: 1,
+    HealthStatus.FAILING: 2,
+    HealthStatus.UNKNOWN: -1,
+}
+
+# Zeroed per-status counts, copied by get_summary()
+EMPTY_STATUS_COUNTS = {status.value: 0 for status in HealthStatus}
+
+
 # =============================================================================
 # DATA MODELS
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class ScrapeAttempt:
     """Record of a single scrape attempt."""
     timestamp: datetime
@@ -98,7 +127,7 @@ class ScrapeAttempt:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ScraperHealth:
     """Health status and metrics for a scraper."""
     scraper_id: str
@@ -157,7 +186,7 @@ class ScraperHealth:
         return self.status == HealthStatus.FAILING
 
 
-@dataclass
+@dataclass(slots=True)
 class HealthAlert:
     """Alert generated when scraper health degrades."""
     scraper_id: str
@@ -188,7 +217,9 @@ class HealthService:
     Features:
     - Records scrape attempts (success/failure)
     - Computes health status based on recent history
-    - Persists health data to JSON file
+    - Persists health data to a JSON snapshot plus an append-only attempt
+      log (<health_file>.jsonl); the snapshot is rewritten on a debounce
+      and flush() forces it
     - Generates alerts on status changes
     - Provides retry logic with exponential backoff
 
@@ -214,7 +245,8 @@ class HealthService:
 
         Args:
             health_file: Path to JSON file for persistence.
-                        Defaults to config/scraper_health.json
+                        Defaults to config/scraper_health.json;
+                        a .gz path is stored gzip-compressed
         """
         self.health_file = Path(health_file) if health_file else DEFAULT_HEALTH_FILE
 
@@ -227,15 +259,27 @@ class HealthService:
                 shutil.move(str(old_path), str(self.health_file))
                 logger.info("Migrated scraper_health.json from config/ to data/state/")
 
+        self.compressed = self.health_file.suffix == ".gz"
+        snapshot_name = self.health_file.with_suffix("") if self.compressed else self.health_file
+        self.log_path = snapshot_name.with_suffix(".jsonl")
+
         self._health_data: dict[str, ScraperHealth] = {}
         self._alerts: list[HealthAlert] = []
+        self._lock = threading.RLock()
+        self._dirty = False
+        self._save_timer: Optional[threading.Timer] = None
+        self._log_fp = None
+        self._log_entries = 0
         self._load()
+        self._replay_log()
+        _live_services.add(self)
 
     def _load(self) -> None:
         """Load health data from file."""
         if self.health_file.exists():
             try:
-                data = json.loads(self.health_file.read_text(encoding="utf-8"))
+                raw = self.health_file.read_bytes()
+                data = loads(gzip.decompress(raw) if self.compressed else raw)
                 for scraper_id, health_dict in data.get("scrapers", {}).items():
                     self._health_data[scraper_id] = ScraperHealth.from_dict(health_dict)
                 logger.info(
@@ -250,8 +294,42 @@ class HealthService:
                 )
                 self._health_data = {}
 
-    def _save(self) -> None:
-        """Save health data to file."""
+    def _replay_log(self) -> None:
+        """Apply attempts and resets logged since the last snapshot."""
+        if not self.log_path.exists():
+            return
+
+        try:
+            with open(self.log_path, 'rb') as f:
+                for line_no, line in enumerate(f, 1):
+                    if not line.strip():
+                        continue
+                    try:
+                        entry = loads(line)
+                        scraper_id = entry["scraper_id"]
+                        if entry["op"] == "attempt":
+                            attempt = ScrapeAttempt.from_dict(entry["attempt"])
+                            health = self._health_data.get(scraper_id)
+                            # Already in the snapshot if a crash hit between
+                            # the snapshot rewrite and the log removal
+                            if health is None or health.last_attempt is None or attempt.timestamp > health.last_attempt:
+                                self._apply_attempt(scraper_id, attempt)
+                        elif entry["op"] == "reset":
+                            self._health_data.pop(scraper_id, None)
+                    except Exception as e:
+                        # e.g. a torn last line from a crash mid-append
+                        logger.warning("Skipping unreadable health log entry", line=line_no, error=str(e))
+                        continue
+                    self._log_entries += 1
+
+            # Fold the replayed entries into the next snapshot
+            self._dirty = self._log_entries > 0
+            logger.debug("Replayed health log", entries=self._log_entries, path=str(self.log_path))
+        except Exception as e:
+            logger.error("Failed to replay health log", error=str(e))
+
+    def _save(self) -> bool:
+        """Save health data to file (atomically, via a temp file)."""
         try:
             self.health_file.parent.mkdir(parents=True, exist_ok=True)
             data = {
@@ -261,16 +339,93 @@ class HealthService:
                 },
                 "last_updated": datetime.now().isoformat(),
             }
-            self.health_file.write_text(
-                json.dumps(data, indent=2, default=str),
-                encoding="utf-8"
-            )
+            if self.compressed:
+                payload = gzip.compress(dumps(data), compresslevel=GZIP_COMPRESSLEVEL)
+            else:
+                payload = dumps(data, indent=True)
+
+            tmp_path = self.health_file.with_suffix(self.health_file.suffix + ".tmp")
+            with open(tmp_path, 'wb') as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.health_file)
+            return True
         except Exception as e:
             logger.error("Failed to save health data", error=str(e))
+            return False
 
-    def _prune_old_attempts(self, health: ScraperHealth) -> None:
-        """Remove attempts outside the health window."""
-        cutoff = datetime.now() - timedelta(hours=HEALTH_WINDOW_HOURS)
+    def _log_has_torn_tail(self) -> bool:
+        """Check whether the log ends mid-line."""
+        try:
+            with open(self.log_path, 'rb') as f:
+                f.seek(0, os.SEEK_END)
+                if f.tell() == 0:
+                    return False
+                f.seek(-1, os.SEEK_END)
+                return f.read(1) != b"\n"
+        except FileNotFoundError:
+            return False
+
+    def _append_log(self, entry: dict[str, Any]) -> None:
+        """
+        Append one change to the attempt log and schedule a snapshot.
+
+        The line is flushed to the OS, so a restart replays it even if
+        the snapshot was never rewritten.
+        """
+        try:
+            if self._log_fp is None:
+                self.log_path.parent.mkdir(parents=True, exist_ok=True)
+                torn_tail = self._log_has_torn_tail()
+                self._log_fp = open(self.log_path, 'ab')
+                if torn_tail:
+                    # Keep the next entry off a partial line left by a crash
+                    self._log_fp.write(b"\n")
+            self._log_fp.write(dumps(entry) + b"\n")
+            self._log_fp.flush()
+            self._log_entries += 1
+        except Exception as e:
+            logger.error("Failed to append health log", error=str(e))
+
+        if self._log_entries >= COMPACT_LOG_ENTRIES:
+            self._dirty = True
+            self.flush()
+        else:
+            self._schedule_save()
+
+    def _schedule_save(self) -> None:
+        """Mark health data dirty and arm a single debounced write."""
+        with self._lock:
+            self._dirty = True
+            if self._save_timer is None:
+                self._save_timer = threading.Timer(SAVE_DEBOUNCE_SECONDS, self.flush)
+                self._save_timer.daemon = True
+                self._save_timer.start()
+
+    def flush(self) -> None:
+        """
+        Rewrite the snapshot now and truncate the attempt log.
+
+        Also runs at interpreter exit. The log is only removed once the
+        new snapshot is in place.
+        """
+        with self._lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            if self._dirty:
+                self._dirty = False
+                if self._save():
+                    if self._log_fp is not None:
+                        self._log_fp.close()
+                        self._log_fp = None
+                    self.log_path.unlink(missing_ok=True)
+                    self._log_entries = 0
+
+    def _prune_old_attempts(self, health: ScraperHealth, now: Optional[datetime] = None) -> None:
+        """Remove attempts outside the health window ending at now."""
+        cutoff = (now or datetime.now()) - timedelta(hours=HEALTH_WINDOW_HOURS)
 
         # Keep attempts within time window, up to max count
         recent = [a for a in health.attempts if a.timestamp > cutoff]
@@ -324,13 +479,6 @@ class HealthService:
         Returns:
             Updated ScraperHealth for this scraper
         """
-        # Get or create health record
-        if scraper_id not in self._health_data:
-            self._health_data[scraper_id] = ScraperHealth(scraper_id=scraper_id)
-
-        health = self._health_data[scraper_id]
-        previous_status = health.status
-
         # Create attempt record
         attempt = ScrapeAttempt(
             timestamp=datetime.now(),
@@ -341,12 +489,58 @@ class HealthService:
             error_message=error_message,
         )
 
+        with self._lock:
+            health, previous_status = self._apply_attempt(scraper_id, attempt)
+
+            # Log the attempt
+            log_method = logger.info if success else logger.warning
+            log_method(
+                "Scrape attempt recorded",
+                scraper_id=scraper_id,
+                success=success,
+                items_found=items_found,
+                duration_ms=round(duration_ms, 2),
+                status=health.status.value,
+                consecutive_failures=health.consecutive_failures,
+            )
+
+            # Check for status change and generate alert
+            if previous_status != health.status and previous_status != HealthStatus.UNKNOWN:
+                self._generate_alert(scraper_id, previous_status, health.status)
+
+            # Persist: one log line now, the snapshot on the debounce
+            self._append_log({
+                "op": "attempt",
+                "scraper_id": scraper_id,
+                "attempt": attempt.to_dict(),
+            })
+
+        return health
+
+    def _apply_attempt(
+        self,
+        scraper_id: str,
+        attempt: ScrapeAttempt
+    ) -> tuple[ScraperHealth, HealthStatus]:
+        """
+        Fold an attempt into a scraper's health record.
+
+        Returns:
+            (updated ScraperHealth, status before the attempt)
+        """
+        # Get or create health record
+        if scraper_id not in self._health_data:
+            self._health_data[scraper_id] = ScraperHealth(scraper_id=scraper_id)
+
+        health = self._health_data[scraper_id]
+        previous_status = health.status
+
         # Update health record
         health.attempts.append(attempt)
         health.total_attempts += 1
         health.last_attempt = attempt.timestamp
 
-        if success:
+        if attempt.success:
             health.last_success = attempt.timestamp
             health.consecutive_failures = 0
         else:
@@ -354,29 +548,9 @@ class HealthService:
             health.consecutive_failures += 1
 
         # Prune old attempts and recompute status
-        self._prune_old_attempts(health)
+        self._prune_old_attempts(health, now=attempt.timestamp)
         health.status = self._compute_status(health)
-
-        # Log the attempt
-        log_method = logger.info if success else logger.warning
-        log_method(
-            "Scrape attempt recorded",
-            scraper_id=scraper_id,
-            success=success,
-            items_found=items_found,
-            duration_ms=round(duration_ms, 2),
-            status=health.status.value,
-            consecutive_failures=health.consecutive_failures,
-        )
-
-        # Check for status change and generate alert
-        if previous_status != health.status and previous_status != HealthStatus.UNKNOWN:
-            self._generate_alert(scraper_id, previous_status, health.status)
-
-        # Persist
-        self._save()
-
-        return health
+        return health, previous_status
 
     def _generate_alert(
         self,
@@ -386,14 +560,7 @@ class HealthService:
     ) -> None:
         """Generate alert for status change."""
         # Determine if this is a degradation or recovery
-        status_order = {
-            HealthStatus.HEALTHY: 0,
-            HealthStatus.DEGRADED: 1,
-            HealthStatus.FAILING: 2,
-            HealthStatus.UNKNOWN: -1,
-        }
-
-        is_degradation = status_order[current] > status_order[previous]
+        is_degradation = STATUS_ORDER[current] > STATUS_ORDER[previous]
 
         if is_degradation:
             message = f"Scraper '{scraper_id}' degraded from {previous.value} to {current.value}"
@@ -458,9 +625,11 @@ class HealthService:
 
     def get_scrapers_needing_attention(self) -> list[str]:
         """Get list of scrapers that need manual attention."""
+        with self._lock:
+            items = list(self._health_data.items())
         return [
             scraper_id
-            for scraper_id, health in self._health_data.items()
+            for scraper_id, health in items
             if health.needs_attention
         ]
 
@@ -470,10 +639,12 @@ class HealthService:
 
         Use after manual intervention to give scraper a fresh start.
         """
-        if scraper_id in self._health_data:
+        with self._lock:
+            if scraper_id not in self._health_data:
+                return
             del self._health_data[scraper_id]
-            self._save()
-            logger.info("Reset health data", scraper_id=scraper_id)
+            self._append_log({"op": "reset", "scraper_id": scraper_id})
+        logger.info("Reset health data", scraper_id=scraper_id)
 
     def get_summary(self) -> dict[str, Any]:
         """
@@ -483,7 +654,16 @@ class HealthService:
             Dictionary with health summary for API/dashboard
         """
         scrapers = []
-        for scraper_id, health in self._health_data.items():
+        needing_attention = []
+        status_counts = EMPTY_STATUS_COUNTS.copy()
+        # Snapshot under the lock: record_scrape/reset_health mutate the dict
+        # from other threads
+        with self._lock:
+            items = list(self._health_data.items())
+        for scraper_id, health in items:
+            status_counts[health.status.value] += 1
+            if health.needs_attention:
+                needing_attention.append(scraper_id)
             scrapers.append({
                 "scraper_id": scraper_id,
                 "status": health.status.value,
@@ -494,20 +674,28 @@ class HealthService:
                 "needs_attention": health.needs_attention,
             })
 
-        # Count by status
-        status_counts = {s.value: 0 for s in HealthStatus}
-        for health in self._health_data.values():
-            status_counts[health.status.value] += 1
-
         return {
-            "total_scrapers": len(self._health_data),
+            "total_scrapers": len(items),
             "status_counts": status_counts,
             "scrapers": scrapers,
             "alerts_pending": len(self._alerts),
-            "scrapers_needing_attention": self.get_scrapers_needing_attention(),
+            "scrapers_needing_attention": needing_attention,
         }
 
 
+# Services flushed at interpreter exit. Weak references, so a discarded
+# service (e.g. one a test built over a temp dir) is never kept alive or
+# written after it is gone.
+_live_services: "weakref.WeakSet[HealthService]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_live_services() -> None:
+    """Write pending health data for every live HealthService."""
+    for service in list(_live_services):
+        service.flush()
+
+
 # =============================================================================
 # RETRY DECORATOR
 # =============================================================================
@@ -607,8 +795,6 @@ def with_retry(
 # SINGLETON ACCESS
 # =============================================================================
 
-import threading
-
 _health_service: Optional[HealthService] = None
 _health_lock = threading.Lock()
 
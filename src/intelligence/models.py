@@ -40,7 +40,7 @@ class AlertSeverity(str, Enum):
     URGENT = "urgent"
 
 
-@dataclass
+@dataclass(slots=True)
 class GeoLocation:
     """Geographic location for spatial queries."""
     latitude: float
@@ -66,7 +66,7 @@ class GeoLocation:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Entity:
     """
     An entity extracted from civic events.
@@ -122,7 +122,7 @@ class Entity:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Document:
     """A document attached to a civic event."""
     document_id: str
@@ -160,7 +160,7 @@ class Document:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class CivicEvent:
     """
     Unified event model for all civic data sources.
@@ -267,13 +267,17 @@ class CivicEvent:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "CivicEvent":
         """Create from dictionary."""
+        # Only fall back to now() when a timestamp is missing; stored events
+        # always carry both, so the common path is a single parse each.
+        discovered_at = data.get("discovered_at")
+        updated_at = data.get("updated_at")
         return cls(
             event_id=data["event_id"],
             event_type=EventType(data["event_type"]),
             source_id=data["source_id"],
             timestamp=datetime.fromisoformat(data["timestamp"]),
-            discovered_at=datetime.fromisoformat(data.get("discovered_at", datetime.now().isoformat())),
-            updated_at=datetime.fromisoformat(data.get("updated_at", datetime.now().isoformat())),
+            discovered_at=datetime.fromisoformat(discovered_at) if discovered_at else datetime.now(),
+            updated_at=datetime.fromisoformat(updated_at) if updated_at else datetime.now(),
             title=data["title"],
             description=data.get("description"),
             location=GeoLocation.from_dict(data["location"]) if data.get("location") else None,
@@ -286,7 +290,7 @@ class CivicEvent:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Alert:
     """
     A watchdog alert generated by the rules engine.
@@ -0,0 +1,56 @@
+"""
+JSON encoding for the intelligence layer's state files.
+
+Event store snapshots/logs and scraper health files go through dumps()
+and loads(). orjson is used when installed (several times faster on a
+large events.json); otherwise the standard library json module is used.
+Either way dumps() returns UTF-8 bytes and loads() accepts str or bytes.
+"""
+
+import json
+from datetime import date, time
+from functools import lru_cache
+from typing import Any, Optional
+
+
+@lru_cache(maxsize=1)
+def _orjson() -> Optional[Any]:
+    """Return the orjson module, or None if the optional package is missing."""
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson
+
+
+def _default(obj: Any) -> str:
+    """Encode types JSON lacks: ISO strings for dates/times, else str()."""
+    if isinstance(obj, (date, time)):
+        return obj.isoformat()
+    return str(obj)
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """
+    Encode obj as UTF-8 JSON bytes.
+
+    Args:
+        obj: Value to encode; datetimes become ISO strings and other
+            unknown types are encoded with str()
+        indent: Pretty-print with two-space indentation
+    """
+    orjson = _orjson()
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, default=_default, option=option)
+
+    return json.dumps(obj, indent=2 if indent else None, default=_default).encode("utf-8")
+
+
+def loads(data: bytes | str) -> Any:
+    """Decode JSON from bytes or str."""
+    orjson = _orjson()
+    if orjson is not None:
+        return orjson.loads(data)
+
+    return json.loads(data)
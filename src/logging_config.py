@@ -193,9 +193,11 @@ def configure_logging() -> None:
         )
         root_logger.addHandler(file_handler)
 
-    # Configure structlog to use stdlib logging
+    # Configure structlog to use stdlib logging. filter_by_level runs first
+    # so calls below LOG_LEVEL (e.g. per-row debug logs in batch loops) are
+    # dropped before any processor builds the event.
     structlog.configure(
-        processors=pre_chain + [
+        processors=[structlog.stdlib.filter_by_level] + pre_chain + [
             structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
         ],
         wrapper_class=structlog.stdlib.BoundLogger,
@@ -591,15 +591,16 @@ class Orchestrator:
 
         try:
             # Get unanalyzed meetings
-            unanalyzed = self.db.get_unanalyzed_meetings(source_id)
+            # Scout analysis needs the extracted PDF text
+            unanalyzed = self.db.get_unanalyzed_meetings(source_id, columns="*")
+
+            # Build watchlist from entities config (read-only, shared by every meeting)
+            entities = load_entities_config()
+            watchlist = self._build_watchlist(entities)
 
             analyzed_count = 0
             for meeting in unanalyzed[:10]:  # Limit to 10 per run
                 try:
-                    # Build watchlist from entities config
-                    entities = load_entities_config()
-                    watchlist = self._build_watchlist(entities)
-
                     # Ingest PDF content into RAG pipeline (if available)
                     pdf_content = meeting.get('pdf_content', '')
                     if pdf_content:
@@ -758,7 +759,8 @@ class Orchestrator:
             high_relevance_reports = self.db.get_high_relevance_reports(
                 source_id=source_id,
                 min_relevance=relevance_threshold,
-                needs_deep_research=True
+                needs_deep_research=True,
+                limit=3  # Limit to 3 per run (expensive)
             )
 
             if not high_relevance_reports:
@@ -766,7 +768,7 @@ class Orchestrator:
                 return 0
 
             researched_count = 0
-            for report in high_relevance_reports[:3]:  # Limit to 3 per run (expensive)
+            for report in high_relevance_reports:
                 try:
                     # Extract topic from report
                     topic = report.get('executive_summary', '')[:200]
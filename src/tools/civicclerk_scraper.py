@@ -29,7 +29,7 @@ from src.intelligence.health import get_health_service, HealthService
 logger = get_logger("tools.civicclerk")
 
 
-@dataclass
+@dataclass(slots=True)
 class CivicClerkMeeting:
     """Represents a meeting extracted from CivicClerk portal."""
 
@@ -725,9 +725,13 @@ class CivicClerkScraper:
             'updated': [],
             'unchanged': []
         }
+        # Keyed by (meeting_id, source_id): a meeting listed twice is written
+        # once, with its last-seen data
+        pending = {}
+        existing_rows = db.get_meetings_bulk(source_id, [m.meeting_id for m in meetings])
 
         for meeting in meetings:
-            existing = db.get_meeting(meeting.meeting_id, source_id)
+            existing = existing_rows.get(meeting.meeting_id)
 
             meeting_data = {
                 'meeting_id': meeting.meeting_id,
@@ -745,15 +749,20 @@ class CivicClerkScraper:
                 }
             }
 
+            key = (meeting.meeting_id, source_id)
             if not existing:
-                result['new'].append(meeting.meeting_id)
-                db.upsert_meeting(meeting_data)
+                pending[key] = ('new', meeting_data)
             elif existing.get('agenda_posted_date') != (meeting.agenda_posted_date.isoformat() if meeting.agenda_posted_date else None):
                 # Agenda was posted or updated
-                result['updated'].append(meeting.meeting_id)
-                db.upsert_meeting(meeting_data)
+                pending[key] = ('updated', meeting_data)
             else:
-                result['unchanged'].append(meeting.meeting_id)
+                pending[key] = ('unchanged', None)
+
+        # Only rows the database accepted count as new/updated
+        written = db.upsert_meetings_written([data for _, data in pending.values() if data])
+        for key, (status, data) in pending.items():
+            if data is None or key in written:
+                result[status].append(key[0])
 
         logger.info(
             "Synced meetings to database",
@@ -884,9 +893,15 @@ class CivicClerkScraper:
                 'attempted': len(meetings_to_download),
                 'detail_fetched': 0,
                 'success': 0,
+                'unchanged': 0,
                 'failed': 0
             }
 
+            # One round-trip for every stored hash instead of one per meeting
+            stored_hashes = db.get_content_hashes(
+                source_id, [m.meeting_id for m in meetings_to_download]
+            )
+
             for meeting in meetings_to_download:
                 # First, fetch PDF URLs from the event files page
                 if not meeting.agenda_pdf_url and not meeting.agenda_packet_pdf_url:
@@ -902,8 +917,13 @@ class CivicClerkScraper:
                 content = self.download_meeting_pdf(meeting)
 
                 if content:
-                    # Update database with PDF content
                     content_hash = db.compute_content_hash(content)
+                    if stored_hashes.get(meeting.meeting_id) == content_hash:
+                        # Same PDF text already stored - skip rewriting it
+                        pdf_results['unchanged'] += 1
+                        continue
+
+                    # Update database with PDF content
                     db.upsert_meeting({
                         'meeting_id': meeting.meeting_id,
                         'source_id': source_id,
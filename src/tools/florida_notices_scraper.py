@@ -703,9 +703,13 @@ class FloridaNoticesScraper:
         source_id = "florida-public-notices"
 
         result = {'new': [], 'updated': [], 'unchanged': []}
+        # Keyed by (notice_id, source_id): a notice listed twice is written
+        # once, with its last-seen data
+        pending = {}
+        existing_rows = db.get_meetings_bulk(source_id, [n.notice_id for n in notices])
 
         for notice in notices:
-            existing = db.get_meeting(notice.notice_id, source_id)
+            existing = existing_rows.get(notice.notice_id)
 
             notice_data = {
                 'meeting_id': notice.notice_id,
@@ -723,11 +727,17 @@ class FloridaNoticesScraper:
                 }
             }
 
+            key = (notice.notice_id, source_id)
             if not existing:
-                result['new'].append(notice.notice_id)
-                db.upsert_meeting(notice_data)
+                pending[key] = ('new', notice_data)
             else:
-                result['unchanged'].append(notice.notice_id)
+                pending[key] = ('unchanged', None)
+
+        # Only rows the database accepted count as new
+        written = db.upsert_meetings_written([data for _, data in pending.values() if data])
+        for key, (status, data) in pending.items():
+            if data is None or key in written:
+                result[status].append(key[0])
 
         logger.info(
             "Synced notices to database",
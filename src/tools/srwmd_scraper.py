@@ -17,7 +17,7 @@ Permit numbers are hyperlinks to the E-Permitting portal.
 import re
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, List
+from typing import Dict, Optional, List
 from enum import Enum
 
 from src.logging_config import get_logger
@@ -822,10 +822,23 @@ class SRWMDScraper:
             Dict with 'new', 'updated', 'unchanged' counts
         """
         result = {'new': [], 'updated': [], 'unchanged': []}
+        # Keyed by (notice_id, source_id): a notice listed twice is written
+        # once, with its last-seen data
+        pending = {}
+
+        # Notices span several source IDs; fetch existing rows per source
+        ids_by_source: Dict[str, List[str]] = {}
+        for notice in notices:
+            ids_by_source.setdefault(f"srwmd-{notice.notice_type.value}s", []).append(notice.notice_id)
+        existing_rows = {
+            (meeting_id, source_id): row
+            for source_id, ids in ids_by_source.items()
+            for meeting_id, row in db.get_meetings_bulk(source_id, ids).items()
+        }
 
         for notice in notices:
             source_id = f"srwmd-{notice.notice_type.value}s"
-            existing = db.get_meeting(notice.notice_id, source_id)
+            existing = existing_rows.get((notice.notice_id, source_id))
 
             notice_data = {
                 'meeting_id': notice.notice_id,
@@ -845,11 +858,17 @@ class SRWMDScraper:
                 }
             }
 
+            key = (notice.notice_id, source_id)
             if not existing:
-                result['new'].append(notice.notice_id)
-                db.upsert_meeting(notice_data)
+                pending[key] = ('new', notice_data)
             else:
-                result['unchanged'].append(notice.notice_id)
+                pending[key] = ('unchanged', None)
+
+        # Only rows the database accepted count as new
+        written = db.upsert_meetings_written([data for _, data in pending.values() if data])
+        for key, (status, data) in pending.items():
+            if data is None or key in written:
+                result[status].append(key[0])
 
         logger.info(
             "Synced permits to database",
@@ -665,7 +665,7 @@ def render_scout_analysis_tester():
     # Fetch meetings from database
     if st.button("📥 Load Meetings from Database", key="load_meetings"):
         with st.spinner("Loading meetings..."):
-            meetings = db.get_meetings_by_source(source_id)
+            meetings = db.get_meetings_by_source(source_id, columns="*")
             st.session_state['loaded_meetings'] = meetings
             st.success(f"Loaded {len(meetings)} meetings")
 
@@ -89,3 +89,27 @@ class TestApprovalEndpoints:
         response = app_client.post("/approvals/nonexistent-id/decide", json={"decision": "approved"})
         
         assert response.status_code in [404, 422]
+
+
+class TestStreamEndpoints:
+    """Tests for SSE run streaming."""
+
+    async def test_event_generator_terminal_run_yields_once(self):
+        """Test a finished run emits its status immediately and stops."""
+        from src.app import event_generator, state
+
+        state.save_run("stream-done", {"run_id": "stream-done", "status": "completed"})
+
+        events = [event async for event in event_generator("stream-done")]
+
+        assert len(events) == 1
+        assert events[0]["event"] == "status"
+        assert '"completed"' in events[0]["data"]
+
+    async def test_event_generator_unknown_run_yields_nothing(self):
+        """Test an unknown run ends the stream without polling."""
+        from src.app import event_generator
+
+        events = [event async for event in event_generator("stream-missing")]
+
+        assert events == []
@@ -110,3 +110,97 @@ class TestPydanticModels:
         assert config.retry_on_failure is True
         assert config.max_retries == 3
         assert config.requires_approval is False
+
+
+class TestSourceCaching:
+    """Tests for cached SourceConfig materialization."""
+
+    def test_sources_parsed_once(self):
+        """Test repeated calls share the cached SourceConfig objects."""
+        from src.config import get_all_sources, get_sources_by_tier, clear_config_cache
+
+        clear_config_cache()
+        first = get_all_sources()
+        second = get_all_sources()
+
+        assert first == second
+        assert first is not second  # callers get their own list
+        assert all(a is b for a, b in zip(first, second))
+        assert sum(len(get_sources_by_tier(t)) for t in range(1, 8)) == len(first)
+
+    def test_clear_config_cache_rebuilds_sources(self):
+        """Test clear_config_cache() drops the materialized sources."""
+        from src.config import get_all_sources, clear_config_cache
+
+        before = get_all_sources()
+        clear_config_cache()
+        after = get_all_sources()
+
+        assert before == after
+        assert before[0] is not after[0]
+
+    def test_unknown_tier_returns_empty(self):
+        """Test out-of-range tiers return no sources."""
+        from src.config import get_sources_by_tier
+
+        assert get_sources_by_tier(99) == []
+
+
+class TestKeywords:
+    """Tests for watchlist keyword helpers."""
+
+    def test_all_keywords_is_cached_frozenset(self):
+        """Test keywords are built once and returned immutable."""
+        from src.config import get_all_keywords, get_projects, clear_config_cache
+
+        clear_config_cache()
+        keywords = get_all_keywords()
+
+        assert isinstance(keywords, frozenset)
+        assert get_all_keywords() is keywords
+        for project in get_projects():
+            assert set(project.keywords) <= keywords
+            assert set(project.aliases) <= keywords
+
+
+class TestLeafConfigs:
+    """Tests for slotted dataclass leaf configs."""
+
+    def test_leaf_configs_are_slotted_and_frozen(self):
+        """Test leaf configs carry no __dict__ and reject mutation."""
+        import dataclasses
+        from src.config import ScrapingConfig
+
+        scraping = ScrapingConfig(method="firecrawl")
+
+        assert not hasattr(scraping, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            scraping.method = "api"
+
+    def test_leaf_configs_validated_inside_models(self):
+        """Test pydantic still validates dataclass fields from YAML dicts."""
+        from pydantic import ValidationError
+        from src.config import Jurisdiction, Municipality
+
+        jurisdiction = Jurisdiction(
+            state="FL",
+            county="Alachua",
+            municipalities=[{"name": "Alachua", "population": "10000"}],
+        )
+
+        assert jurisdiction.municipalities == [Municipality(name="Alachua", population=10000)]
+        with pytest.raises(ValidationError):
+            Jurisdiction(state="FL", county="Alachua", municipalities=[{"population": 1}])
+
+
+class TestEntityCaching:
+    """Tests for cached watchlist entity parsing."""
+
+    def test_entities_parsed_once(self):
+        """Test projects/organizations share one cached parse."""
+        from src.config import get_projects, get_organizations, clear_config_cache
+
+        clear_config_cache()
+
+        assert all(a is b for a, b in zip(get_projects(), get_projects()))
+        assert all(a is b for a, b in zip(get_organizations(), get_organizations()))
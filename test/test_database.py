@@ -0,0 +1,401 @@
+"""
+Tests for the Supabase Database wrapper.
+
+The Supabase client is replaced with a MagicMock so these tests only check
+which queries are issued and how rows are shaped.
+"""
+
+import pytest
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+
+@pytest.fixture
+def db():
+    """Database with a mocked Supabase client."""
+    with patch("supabase.create_client") as mock_create_client:
+        mock_create_client.return_value = MagicMock()
+        from src.database import Database
+        yield Database()
+
+
+class TestBatchUpserts:
+    """Tests for batched upsert helpers."""
+
+    def test_upsert_meetings_single_round_trip(self, db):
+        """Test many meetings are sent in one upsert call."""
+        meetings = [
+            {"meeting_id": str(i), "source_id": "src", "title": "t", "meeting_date": datetime(2026, 1, i + 1)}
+            for i in range(3)
+        ]
+
+        written = db.upsert_meetings(meetings)
+
+        assert written == 3
+        upsert = db.supabase.table.return_value.upsert
+        upsert.assert_called_once()
+        rows = upsert.call_args.args[0]
+        assert [r["meeting_id"] for r in rows] == ["0", "1", "2"]
+        assert rows[0]["meeting_date"] == "2026-01-01T00:00:00"
+        assert len({r["last_scraped_at"] for r in rows}) == 1
+
+    def test_upsert_meetings_chunks_large_batches(self, db):
+        """Test batches are split at UPSERT_BATCH_SIZE."""
+        from src.database import UPSERT_BATCH_SIZE
+
+        meetings = [{"meeting_id": str(i), "source_id": "src"} for i in range(UPSERT_BATCH_SIZE + 1)]
+
+        assert db.upsert_meetings(meetings) == UPSERT_BATCH_SIZE + 1
+        assert db.supabase.table.return_value.upsert.call_count == 2
+
+    def test_upsert_meetings_written_skips_failed_batches(self, db):
+        """Test only keys from batches that reached the database are reported."""
+        meetings = [{"meeting_id": str(i), "source_id": "src"} for i in range(3)]
+        db.supabase.table.return_value.upsert.return_value.execute.side_effect = [
+            MagicMock(), Exception("boom")
+        ]
+
+        written = db.upsert_meetings_written(meetings, batch_size=2)
+
+        assert written == {("0", "src"), ("1", "src")}
+
+    def test_batch_size_is_tunable(self, db):
+        """Test callers can override the rows-per-request limit."""
+        documents = [{"document_id": str(i), "content": "x"} for i in range(5)]
+
+        assert db.save_documents(documents, batch_size=2) == 5
+        assert db.supabase.table.return_value.upsert.call_count == 3
+
+    def test_upsert_meetings_empty_is_noop(self, db):
+        """Test an empty batch issues no requests."""
+        assert db.upsert_meetings([]) == 0
+        db.supabase.table.assert_not_called()
+
+    def test_save_reports_batches(self, db, sample_scout_report):
+        """Test reports are saved in one upsert call."""
+        assert db.save_reports([sample_scout_report, sample_scout_report]) == 2
+
+        upsert = db.supabase.table.return_value.upsert
+        upsert.assert_called_once()
+        payload = upsert.call_args.args[0]
+        assert payload[0]["id"] == sample_scout_report.report_id
+        assert payload[0]["data"]["executive_summary"] == sample_scout_report.executive_summary
+
+
+class TestReportSerialization:
+    """Tests for report payload serialization."""
+
+    def test_save_report_payload_is_json_compatible(self, db, sample_scout_report):
+        """Test save_report sends plain JSON types (no enums/datetimes)."""
+        import json
+
+        db.save_report(sample_scout_report)
+
+        payload = db.supabase.table.return_value.upsert.call_args.args[0]
+        assert payload["data"] == json.loads(sample_scout_report.model_dump_json())
+        assert payload["data"]["alerts"][0]["level"] == "YELLOW"
+        assert isinstance(payload["data"]["date_generated"], str)
+
+
+class TestContentHashing:
+    """Tests for content hashing and change detection."""
+
+    def test_chunked_hash_matches_one_shot(self, db):
+        """Test chunked text hashing equals hashing the full encoding (SHA256)."""
+        import hashlib
+        from src.database import HASH_CHUNK_CHARS
+
+        content = "Agenda packet – § 4.2 ✓ " * (HASH_CHUNK_CHARS // 8)
+        expected = hashlib.sha256(content.encode()).hexdigest()
+
+        assert db.compute_content_hash(content) == expected
+        assert db.compute_content_hash(content.encode()) == expected
+
+    def test_content_changed_selects_hash_only(self, db):
+        """Test change detection fetches only the content_hash column."""
+        query = db.supabase.table.return_value
+        query.select.return_value.eq.return_value.eq.return_value.execute.return_value.data = [
+            {"content_hash": db.compute_content_hash("same")}
+        ]
+
+        assert db.meeting_content_changed("m1", "src", "same") is False
+        assert db.meeting_content_changed("m1", "src", "different") is True
+        query.select.assert_called_with("content_hash")
+
+    def test_content_changed_for_new_meeting(self, db):
+        """Test unseen meetings are treated as changed."""
+        query = db.supabase.table.return_value
+        query.select.return_value.eq.return_value.eq.return_value.execute.return_value.data = []
+
+        assert db.meeting_content_changed("m1", "src", "anything") is True
+
+    def test_content_changed_uses_read_cache(self, db):
+        """Test a cached meeting row answers without another query."""
+        query = db.supabase.table.return_value
+        query.select.return_value.eq.return_value.eq.return_value.execute.return_value.data = [
+            {"meeting_id": "m1", "content_hash": db.compute_content_hash("same")}
+        ]
+        db.get_meeting("m1", "src")
+
+        assert db.meeting_content_changed("m1", "src", "same") is False
+        assert query.select.call_count == 1
+
+    def test_get_content_hashes_batches_lookup(self, db):
+        """Test stored hashes for many meetings come back in one query."""
+        query = db.supabase.table.return_value.select.return_value.eq.return_value
+        query.in_.return_value.execute.return_value.data = [
+            {"meeting_id": "m1", "content_hash": "h1"},
+            {"meeting_id": "m2", "content_hash": None},
+        ]
+
+        hashes = db.get_content_hashes("src", ["m1", "m2", "m3", "m1"])
+
+        assert hashes == {"m1": "h1", "m2": None}
+        query.in_.assert_called_once_with("meeting_id", ["m1", "m2", "m3"])
+
+    def test_get_content_hashes_error_returns_partial(self, db):
+        """Test a failed lookup leaves meetings out (treated as changed)."""
+        db.supabase.table.side_effect = Exception("boom")
+
+        assert db.get_content_hashes("src", ["m1"]) == {}
+
+
+class TestHighRelevanceReports:
+    """Tests for server-side relevance filtering."""
+
+    def test_filters_pushed_to_query(self, db):
+        """Test relevance and deep-research filters run in PostgREST."""
+        query = db.supabase.table.return_value.select.return_value.eq.return_value
+        filtered = query.filter.return_value
+        ordered = filtered.is_.return_value.order.return_value.order.return_value
+        ordered.execute.return_value.data = [{"id": "r1"}]
+
+        reports = db.get_high_relevance_reports("src", min_relevance=0.8)
+
+        assert reports == [{"id": "r1"}]
+        query.filter.assert_called_once_with("data->relevance_score", "gte", "0.8")
+        filtered.is_.assert_called_once_with("deep_research_id", "null")
+        ordered.limit.assert_not_called()
+
+    def test_ordered_by_relevance(self, db):
+        """Test the most relevant reports come back first."""
+        query = db.supabase.table.return_value.select.return_value.eq.return_value
+        order = query.filter.return_value.is_.return_value.order
+
+        db.get_high_relevance_reports("src")
+
+        order.assert_called_once_with("data->relevance_score", desc=True, nullsfirst=False)
+        order.return_value.order.assert_called_once_with("created_at", desc=True)
+
+    def test_limit_is_optional(self, db):
+        """Test an explicit limit is forwarded to the query."""
+        query = db.supabase.table.return_value.select.return_value.eq.return_value
+        ordered = query.filter.return_value.order.return_value.order.return_value
+
+        db.get_high_relevance_reports("src", needs_deep_research=False, limit=5)
+
+        query.filter.return_value.is_.assert_not_called()
+        ordered.limit.assert_called_once_with(5)
+
+
+class TestColumnProjection:
+    """Tests for default column projections."""
+
+    def test_meeting_reads_skip_pdf_content(self, db):
+        """Test meeting getters don't select pdf_content by default."""
+        from src.database import MEETING_SUMMARY_COLUMNS
+
+        db.get_meeting("m1", "src")
+        db.get_meetings_by_source("src")
+        db.get_unanalyzed_meetings("src")
+
+        select = db.supabase.table.return_value.select
+        assert "pdf_content" not in MEETING_SUMMARY_COLUMNS
+        assert [c.args[0] for c in select.call_args_list] == [MEETING_SUMMARY_COLUMNS] * 3
+
+    def test_full_rows_on_request(self, db):
+        """Test callers can still ask for every column."""
+        db.get_unanalyzed_meetings("src", columns="*")
+
+        db.supabase.table.return_value.select.assert_called_once_with("*")
+
+
+class TestAsyncVariants:
+    """Tests for the async meeting helpers."""
+
+    @pytest.fixture
+    def async_client(self, db):
+        """Async Supabase client mock wired into the db fixture."""
+        client = MagicMock()
+        execute = client.table.return_value.select.return_value.eq.return_value.eq.return_value.execute
+        execute.side_effect = AsyncMock(return_value=MagicMock(data=[{"meeting_id": "m1"}]))
+        client.table.return_value.upsert.return_value.execute = AsyncMock()
+        db._async_supabase = client
+        return client
+
+    async def test_aget_meetings_gathers(self, db, async_client):
+        """Test many meetings are fetched and keyed by (meeting_id, source_id)."""
+        keys = [("m1", "src"), ("m2", "src")]
+
+        rows = await db.aget_meetings(keys, concurrency=1)
+
+        assert list(rows) == keys
+        assert rows[("m1", "src")] == {"meeting_id": "m1"}
+
+    async def test_aupsert_meetings_concurrently(self, db, async_client):
+        """Test concurrent upserts report how many rows were written."""
+        meetings = [{"meeting_id": str(i), "source_id": "src"} for i in range(3)]
+
+        assert await db.aupsert_meetings_concurrently(meetings) == 3
+        assert async_client.table.return_value.upsert.call_count == 3
+        assert all("last_scraped_at" in m for m in meetings)
+
+
+class TestBulkMeetingReads:
+    """Tests for get_meetings_bulk()."""
+
+    def test_one_query_for_many_meetings(self, db):
+        """Test a batch of meetings is fetched with a single in() query."""
+        in_ = db.supabase.table.return_value.select.return_value.eq.return_value.in_
+        in_.return_value.execute.return_value.data = [{"meeting_id": "m1", "content_hash": "h1"}]
+
+        rows = db.get_meetings_bulk("src", ["m1", "m2"])
+
+        assert rows == {"m1": {"meeting_id": "m1", "content_hash": "h1"}}
+        in_.assert_called_once_with("meeting_id", ["m1", "m2"])
+
+    def test_shares_read_cache_with_get_meeting(self, db):
+        """Test bulk reads fill the cache (including misses) for get_meeting."""
+        in_ = db.supabase.table.return_value.select.return_value.eq.return_value.in_
+        in_.return_value.execute.return_value.data = [{"meeting_id": "m1"}]
+
+        db.get_meetings_bulk("src", ["m1", "m2"])
+
+        assert db.get_meeting("m1", "src") == {"meeting_id": "m1"}
+        assert db.get_meeting("m2", "src") is None
+        assert db.get_meetings_bulk("src", ["m1", "m2"]) == {"m1": {"meeting_id": "m1"}}
+        assert db.supabase.table.call_count == 1
+
+
+class TestReadCache:
+    """Tests for the get_meeting/get_document TTL cache."""
+
+    @staticmethod
+    def _meeting_execute(db):
+        return db.supabase.table.return_value.select.return_value.eq.return_value.eq.return_value.execute
+
+    def test_get_meeting_hits_cache(self, db):
+        """Test repeated reads within the TTL make one request."""
+        execute = self._meeting_execute(db)
+        execute.return_value.data = [{"meeting_id": "m1"}]
+
+        assert db.get_meeting("m1", "src") == {"meeting_id": "m1"}
+        assert db.get_meeting("m1", "src") == {"meeting_id": "m1"}
+        assert execute.call_count == 1
+
+    def test_write_invalidates_meeting(self, db):
+        """Test upserting a meeting drops its cached row."""
+        execute = self._meeting_execute(db)
+        execute.return_value.data = []
+
+        assert db.get_meeting("m1", "src") is None
+        db.upsert_meeting({"meeting_id": "m1", "source_id": "src"})
+        db.get_meeting("m1", "src")
+
+        assert execute.call_count == 2
+
+    def test_errors_are_not_cached(self, db):
+        """Test failed reads are retried on the next call."""
+        execute = self._meeting_execute(db)
+        execute.side_effect = [RuntimeError("boom"), MagicMock(data=[{"meeting_id": "m1"}])]
+
+        assert db.get_meeting("m1", "src") is None
+        assert db.get_meeting("m1", "src") == {"meeting_id": "m1"}
+
+    def test_entries_expire(self, db, monkeypatch):
+        """Test entries older than the TTL are refetched."""
+        import src.database as database
+
+        now = [1000.0]
+        monkeypatch.setattr(database.time, "monotonic", lambda: now[0])
+        execute = db.supabase.table.return_value.select.return_value.eq.return_value.execute
+        execute.return_value.data = [{"document_id": "d1"}]
+
+        db.get_document("d1")
+        now[0] += database.READ_CACHE_TTL_SECONDS + 1
+        db.get_document("d1")
+
+        assert execute.call_count == 2
+
+    def test_flush_caches(self, db):
+        """Test flush_caches() forces fresh reads."""
+        execute = self._meeting_execute(db)
+        execute.return_value.data = []
+
+        db.get_meeting("m1", "src")
+        db.flush_caches()
+        db.get_meeting("m1", "src")
+
+        assert execute.call_count == 2
+
+
+class TestTimestamps:
+    """Tests for write timestamps."""
+
+    def test_timestamps_are_utc_aware(self, db):
+        """Test write timestamps carry an explicit UTC offset."""
+        meeting = {"meeting_id": "m1", "source_id": "src"}
+
+        db.upsert_meeting(meeting)
+
+        assert datetime.fromisoformat(meeting["last_scraped_at"]).utcoffset().total_seconds() == 0
+
+
+class TestConnectionPool:
+    """Tests for the shared HTTP connection pool."""
+
+    def test_client_uses_pooled_httpx_client(self, db):
+        """Test the Supabase client is built on the Database's httpx pool."""
+        import httpx
+        import supabase
+
+        options = supabase.create_client.call_args.kwargs["options"]
+
+        assert isinstance(db._http_client, httpx.Client)
+        assert options.httpx_client is db._http_client
+
+
+class TestLazyImport:
+    """Tests for deferred supabase-py loading."""
+
+    def test_module_import_skips_supabase(self):
+        """Test importing src.database doesn't load the supabase client stack."""
+        import subprocess
+        import sys
+        from pathlib import Path
+
+        result = subprocess.run(
+            [sys.executable, "-c", "import sys, src.database; print('supabase' in sys.modules)"],
+            cwd=Path(__file__).parent.parent,
+            capture_output=True,
+            text=True,
+        )
+
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip() == "False"
+
+
+class TestSingleton:
+    """Tests for the get_db() accessor."""
+
+    def test_get_db_returns_one_instance(self, monkeypatch):
+        """Test get_db() builds the Database once, even under concurrent first calls."""
+        from concurrent.futures import ThreadPoolExecutor
+        from src import database
+
+        monkeypatch.setattr(database, "_db", None)
+        with patch("supabase.create_client") as mock_create_client:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                instances = list(pool.map(lambda _: database.get_db(), range(16)))
+            assert all(db is instances[0] for db in instances)
+            mock_create_client.assert_called_once()
@@ -94,7 +94,16 @@ class TestScraperHealth:
         assert health.success_rate == 0.0
         assert health.total_attempts == 0
         assert len(health.attempts) == 0
-    
+
+    def test_health_records_are_slotted(self):
+        """Test health dataclasses carry no per-instance __dict__."""
+        attempt = ScrapeAttempt(timestamp=datetime.now(), success=True)
+        health = ScraperHealth(scraper_id="test", attempts=[attempt])
+
+        assert not hasattr(attempt, "__dict__")
+        assert not hasattr(health, "__dict__")
+        assert health.recent_errors == []
+
     def test_recent_errors_property(self):
         """Test recent_errors extracts error messages."""
         health = ScraperHealth(scraper_id="test")
@@ -287,6 +296,7 @@ class TestHealthService:
         service1 = HealthService(health_file=temp_health_file)
         service1.record_scrape("test", success=True, items_found=10, duration_ms=500)
         service1.record_scrape("test", success=True, items_found=8, duration_ms=600)
+        service1.flush()
         
         # Create new service instance (simulates restart)
         service2 = HealthService(health_file=temp_health_file)
@@ -295,6 +305,129 @@ class TestHealthService:
         assert health.total_attempts == 2
         assert len(health.attempts) == 2
     
+    def test_writes_are_debounced(self, temp_health_file, monkeypatch):
+        """Test a burst of attempts is coalesced into one atomic write."""
+        import src.intelligence.health as health_module
+
+        monkeypatch.setattr(health_module, "SAVE_DEBOUNCE_SECONDS", 60)
+        service = HealthService(health_file=temp_health_file)
+        saves = []
+        original_save = service._save
+        monkeypatch.setattr(service, "_save", lambda: saves.append(1) or original_save())
+
+        for i in range(50):
+            service.record_scrape("test", success=i % 2 == 0, duration_ms=100)
+
+        assert saves == []
+        assert not temp_health_file.exists()
+
+        service.flush()
+        service.flush()  # Nothing pending, no second write
+
+        assert saves == [1]
+        assert json.loads(temp_health_file.read_text())["scrapers"]["test"]["total_attempts"] == 50
+        assert list(temp_health_file.parent.iterdir()) == [temp_health_file]
+
+    def test_attempt_log_replay_and_compaction(self, temp_health_file, monkeypatch):
+        """Test attempts are logged per line, replayed on restart, and compacted."""
+        import src.intelligence.health as health_module
+
+        monkeypatch.setattr(health_module, "SAVE_DEBOUNCE_SECONDS", 60)
+        service1 = HealthService(health_file=temp_health_file)
+        for i in range(3):
+            service1.record_scrape("a", success=True, duration_ms=100)
+        service1.record_scrape("b", success=False)
+        service1.reset_health("b")
+
+        assert len(service1.log_path.read_text().splitlines()) == 5
+
+        # Restart before any snapshot: everything comes back from the log,
+        # and a torn trailing line is skipped
+        with open(service1.log_path, "a") as f:
+            f.write('{"op": "attempt", "scr')
+        service2 = HealthService(health_file=temp_health_file)
+        assert service2.get_health("a").total_attempts == 3
+        assert "b" not in service2.get_all_health()
+
+        # Snapshot written but log left behind (crash mid-compaction):
+        # replaying the leftover log must not double count
+        service2.record_scrape("a", success=True)
+        leftover = service2.log_path.read_bytes()
+        service2.flush()
+        assert not service2.log_path.exists()
+        service2.log_path.write_bytes(leftover)
+        service3 = HealthService(health_file=temp_health_file)
+        assert service3.get_health("a").total_attempts == 4
+
+        # Log growth forces a snapshot before the debounce fires
+        monkeypatch.setattr(health_module, "COMPACT_LOG_ENTRIES", 5)
+        service3.flush()
+        for _ in range(5):
+            service3.record_scrape("a", success=True)
+        assert not service3.log_path.exists()
+        assert json.loads(temp_health_file.read_text())["scrapers"]["a"]["total_attempts"] == 9
+
+    def test_prune_uses_attempt_time(self, health_service):
+        """Test attempts older than the window are pruned on the next record."""
+        health_service.record_scrape("test", success=True)
+        health = health_service.get_health("test")
+        health.attempts.insert(0, ScrapeAttempt(datetime.now() - timedelta(hours=25), success=False))
+
+        health = health_service.record_scrape("test", success=True)
+
+        assert len(health.attempts) == 2
+        assert all(a.success for a in health.attempts)
+
+    def test_gzip_health_file(self, tmp_path):
+        """Test a .gz health file round-trips compressed, with a plain log."""
+        import gzip
+
+        health_file = tmp_path / "health.json.gz"
+        service1 = HealthService(health_file=health_file)
+        service1.record_scrape("test", success=True, items_found=3)
+        assert service1.log_path == tmp_path / "health.jsonl"
+        service1.flush()
+
+        data = json.loads(gzip.decompress(health_file.read_bytes()))
+        assert data["scrapers"]["test"]["total_attempts"] == 1
+
+        service2 = HealthService(health_file=health_file)
+        assert service2.get_health("test").attempts[0].items_found == 3
+
+    def test_exit_flush_holds_services_weakly(self, temp_health_file, tmp_path):
+        """Test the exit hook flushes live services and forgets dropped ones."""
+        import gc
+        import src.intelligence.health as health_module
+
+        live = HealthService(health_file=temp_health_file)
+        live.record_scrape("test", success=True)
+        dropped_file = tmp_path / "dropped" / "health.json"
+        dropped = HealthService(health_file=dropped_file)
+        dropped.record_scrape("test", success=True)
+        dropped.flush()
+        del dropped
+        gc.collect()
+
+        live_files = [s.health_file for s in health_module._live_services]
+        assert temp_health_file in live_files
+        assert dropped_file not in live_files
+        health_module._flush_live_services()
+        assert temp_health_file.exists()
+
+    def test_debounce_timer_saves(self, temp_health_file, monkeypatch):
+        """Test the pending write lands without an explicit flush."""
+        import time
+        import src.intelligence.health as health_module
+
+        monkeypatch.setattr(health_module, "SAVE_DEBOUNCE_SECONDS", 0.01)
+        service = HealthService(health_file=temp_health_file)
+        service.record_scrape("test", success=True)
+
+        deadline = time.monotonic() + 5
+        while not temp_health_file.exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert temp_health_file.exists()
+    
     def test_get_summary(self, health_service):
         """Test getting health summary."""
         health_service.record_scrape("scraper-1", success=True, items_found=5)
@@ -306,6 +439,39 @@ class TestHealthService:
         assert "status_counts" in summary
         assert "scrapers" in summary
         assert summary["total_scrapers"] == 2
+        assert sum(summary["status_counts"].values()) == 2
+        assert summary["scrapers_needing_attention"] == health_service.get_scrapers_needing_attention()
+
+        # The shared zeroed template is copied, never mutated
+        assert health_service.get_summary()["status_counts"] == summary["status_counts"]
+
+    @pytest.mark.parametrize("method", ["get_summary", "get_scrapers_needing_attention"])
+    def test_summary_survives_concurrent_writes(self, health_service, monkeypatch, method):
+        """Test summaries iterate a snapshot while another thread adds scrapers."""
+        import threading
+
+        health_service.record_scrape("scraper-1", success=True)
+        health_service.record_scrape("scraper-2", success=True)
+        needs_attention = ScraperHealth.needs_attention
+        injected = []
+
+        def needs_attention_with_write(health):
+            # Add a scraper from another thread mid-iteration
+            if not injected:
+                injected.append(True)
+                writer = threading.Thread(
+                    target=health_service.record_scrape, args=("late", True)
+                )
+                writer.start()
+                writer.join()
+            return needs_attention.fget(health)
+
+        monkeypatch.setattr(ScraperHealth, "needs_attention", property(needs_attention_with_write))
+
+        getattr(health_service, method)()
+
+        assert injected
+        assert health_service.get_health("late") is not None
 
 
 class TestHealthAlert:
@@ -141,6 +141,10 @@ class TestCivicEventModel:
         assert event.event_id == "test-6"
         assert event.event_type == EventType.MEETING
         assert "planning" in event.tags
+        assert event.discovered_at <= datetime.now()
+
+        data["discovered_at"] = "2026-01-15T08:30:00"
+        assert CivicEvent.from_dict(data).discovered_at == datetime(2026, 1, 15, 8, 30)
 
     def test_content_hash_changes(self):
         """Test that content hash changes when content changes."""
@@ -194,6 +198,22 @@ class TestCivicEventModel:
         assert not event.matches_tags(["permit", "columbia-county"])
         assert event.matches_any_tag(["columbia-county", "alachua-county"])
 
+    def test_models_are_slotted(self):
+        """Test core models carry no per-instance __dict__."""
+        event = CivicEvent(
+            event_id="test-slots",
+            event_type=EventType.MEETING,
+            source_id="test-source",
+            timestamp=datetime(2026, 2, 1, 10, 0),
+            title="Slotted",
+            entities=[Entity(entity_id="org-1", entity_type=EntityType.ORGANIZATION, name="ABC LLC")],
+        )
+
+        assert not hasattr(event, "__dict__")
+        assert not hasattr(event.entities[0], "__dict__")
+        with pytest.raises(AttributeError):
+            event.undeclared = True
+
 
 class TestEntityModel:
     """Tests for Entity dataclass."""
@@ -254,6 +274,41 @@ class TestCivicClerkAdapter:
         assert len(org_entities) >= 1
         assert any("ABC" in e.name for e in org_entities)
 
+    def test_cached_entity_extraction_returns_fresh_entities(self):
+        """Test memoized extraction never shares mutable Entity objects."""
+        adapter = CivicClerkAdapter()
+        text = "XYZ Builders proposes homes at 42 Oak Lane"
+
+        first = adapter.extract_entities_from_text(text)
+        first[0].aliases.append("mutated")
+        second = adapter.extract_entities_from_text(text)
+
+        assert [e.entity_id for e in first] == [e.entity_id for e in second]
+        assert second[0].aliases == []
+
+    def test_entity_extraction_keeps_overlapping_orgs(self):
+        """Test both organization patterns report their own matches."""
+        adapter = CivicClerkAdapter()
+
+        entities = adapter.extract_entities_from_text(
+            "ABC Development LLC proposes project at 123 Main Street"
+        )
+
+        assert [e.entity_id for e in entities] == [
+            "org-abc-development-llc",
+            "org-abc-development",
+            "addr-123-main-street",
+        ]
+
+    def test_normalize_for_id(self):
+        """Test ID normalization for ASCII and non-ASCII text."""
+        adapter = CivicClerkAdapter()
+
+        assert adapter._normalize_for_id("  Planning & Zoning Board  ") == "planning-zoning-board"
+        assert adapter._normalize_for_id("--Foo__Bar!! 123 Main St.") == "foo-bar-123-main-st"
+        assert adapter._normalize_for_id("Café Réunion LLC") == "caf-r-union-llc"
+        assert adapter._normalize_for_id("x" * 80) == "x" * 50
+
     def test_tag_extraction_from_text(self):
         """Test tag extraction from text."""
         adapter = CivicClerkAdapter()
@@ -266,6 +321,43 @@ class TestCivicClerkAdapter:
         assert "development" in tags
         assert "public-hearing" in tags
 
+    def test_tag_extraction_fallback_matches_automaton(self, monkeypatch):
+        """Test the substring fallback returns the same ordered tags."""
+        import src.intelligence.adapters.base_adapter as base_adapter
+
+        adapter = CivicClerkAdapter()
+        text = "Budget waiver and public hearing on rezoning near the Santa Fe River aquifer"
+
+        tags = adapter.extract_tags_from_text(text)
+        monkeypatch.setattr(base_adapter, "_tag_automaton", lambda: None)
+        base_adapter._scan_tags.cache_clear()
+
+        assert adapter.extract_tags_from_text(text) == tags
+        assert tags.index("environmental") < tags.index("water")
+
+    def test_parse_datetime_formats(self):
+        """Test supported date formats parse and unknown ones fall back to now."""
+        adapter = CivicClerkAdapter()
+
+        assert adapter._parse_datetime("2026-02-01") == datetime(2026, 2, 1)
+        assert adapter._parse_datetime("02/01/2026") == datetime(2026, 2, 1)
+        assert adapter._parse_datetime("February 1, 2026") == datetime(2026, 2, 1)
+
+        before = datetime.now()
+        assert adapter._parse_datetime("not a date") >= before
+        assert adapter._parse_datetime("not a date") >= before  # fallback never cached
+
+    def test_parse_datetime_prefers_last_format(self):
+        """Test the last successful format is tried first next time."""
+        import src.intelligence.adapters.civicclerk_adapter as civicclerk_adapter
+
+        adapter = CivicClerkAdapter()
+        adapter._parse_datetime("03/15/2026")
+
+        assert civicclerk_adapter._preferred_date_format == "%m/%d/%Y"
+        assert adapter._parse_datetime("2026-03-16") == datetime(2026, 3, 16)
+        assert civicclerk_adapter._preferred_date_format == "%Y-%m-%d"
+
     def test_adapt_meeting_dict(self):
         """Test adapting meeting dictionary."""
         adapter = CivicClerkAdapter("alachuafl")
@@ -289,6 +381,23 @@ class TestCivicClerkAdapter:
         assert "meeting" in event.tags
         assert "alachua-county" in event.tags
 
+    def test_adapt_meeting_dict_matches_dataclass_path(self):
+        """Test dict input gets the same board tags and description."""
+        adapter = CivicClerkAdapter("alachuafl")
+
+        events = adapter.adapt_from_dict([{
+            "id": "456",
+            "title": "Planning and Zoning Board",
+            "date": "2026-02-01",
+            "board": "Planning and Zoning Board",
+        }])
+
+        event = events[0]
+        assert event.event_id == "civicclerk-alachuafl-456"
+        assert {"planning", "zoning"} <= set(event.tags)
+        assert event.description == "Board: Planning and Zoning Board"
+        assert event.raw_data["id"] == "456"
+
 
 class TestSRWMDAdapter:
     """Tests for SRWMD adapter."""
@@ -309,6 +418,61 @@ class TestSRWMDAdapter:
         assert "water" in tags
         assert "environmental" in tags
 
+    def test_fields_getter_falls_back_to_none(self):
+        """Test bulk attribute reads, with None for missing attributes."""
+        from types import SimpleNamespace
+        from src.intelligence.adapters.base_adapter import fields_getter
+
+        read = fields_getter("notice_id", "county")
+
+        assert read(SimpleNamespace(notice_id="1", county="Alachua")) == ("1", "Alachua")
+        assert read(SimpleNamespace(notice_id="1")) == ("1", None)
+
+    def test_rule_type_tags(self):
+        """Test permit tags derived from the rule type."""
+        from types import SimpleNamespace
+
+        adapter = SRWMDAdapter()
+        notice = SimpleNamespace(
+            notice_id="1", permit_number="ERP-2", rule_type="ERP Individual", county="Columbia",
+        )
+
+        tags = adapter.adapt([notice])[0].tags
+
+        assert tags[:5] == ["permit", "srwmd", "water", "columbia", "erp"]
+        assert "individual-permit" in tags
+        assert "general-permit" not in tags
+
+    def test_county_tags(self):
+        """Test county slug tags, with alachua-county added for Alachua."""
+        adapter = SRWMDAdapter()
+
+        assert adapter._county_tags("Alachua") == ("alachua", "alachua-county")
+        assert adapter._county_tags("St Johns") == ("st-johns",)
+        assert adapter._county_tags(None) == ()
+        assert adapter._county_tags("Columbia")[0] is adapter._county_tags("Columbia")[0]
+
+    def test_notice_type_enum_or_string(self):
+        """Test notice/permit types are read from enums and plain strings."""
+        from enum import Enum
+        from types import SimpleNamespace
+
+        class NoticeType(Enum):
+            ISSUANCE = "Permit Issuance"
+
+        adapter = SRWMDAdapter()
+        base = dict(notice_id="1", permit_number="ERP-1", project_name="Test Site")
+
+        issued, applied = adapter.adapt([
+            SimpleNamespace(**base, notice_type=NoticeType.ISSUANCE, permit_type=NoticeType.ISSUANCE),
+            SimpleNamespace(**base, notice_type="Application", permit_type="ERP"),
+        ])
+
+        assert issued.event_type == EventType.PERMIT_ISSUED
+        assert "Permit Type: Permit Issuance" in issued.description
+        assert applied.event_type == EventType.PERMIT_APPLICATION
+        assert "Permit Type: ERP" in applied.description
+
 
 class TestFloridaNoticesAdapter:
     """Tests for Florida Notices adapter."""
@@ -318,6 +482,118 @@ class TestFloridaNoticesAdapter:
         adapter = FloridaNoticesAdapter()
         assert adapter.source_id == "florida-public-notices"
 
+    def test_tags_deduplicated_in_order(self):
+        """Test notice tags are unique and in a stable order."""
+        adapter = FloridaNoticesAdapter()
+
+        events = adapter.adapt_from_dict([{
+            "notice_id": "n1",
+            "title": "Public hearing on rezoning and rezone request",
+            "county": "Alachua",
+        }])
+
+        tags = events[0].tags
+        assert tags[:3] == ["public-notice", "legal-notice", "alachua"]
+        assert len(tags) == len(set(tags))
+
+    def test_iter_adapt_is_lazy(self):
+        """Test iter_adapt yields events as notices are consumed."""
+        from types import SimpleNamespace
+
+        adapter = FloridaNoticesAdapter()
+        notices = (
+            SimpleNamespace(notice_id=n, title=f"Notice {n}", county="Alachua")
+            for n in ("a", None, "b")
+        )
+
+        events = adapter.iter_adapt(notices)
+        first = next(events)
+
+        assert first.event_id == "florida-notice-a"
+        assert [e.event_id for e in events] == ["florida-notice-b"]
+        assert adapter.adapt([]) == []
+
+    def test_title_and_content_scanned_together(self):
+        """Test the joined scan matches per-segment extraction, deduplicated."""
+        from types import SimpleNamespace
+
+        adapter = FloridaNoticesAdapter()
+        title = "Rezoning for ABC Development LLC"
+        content = "Smith\nCorp filed a wetland permit. ABC Development LLC owns 123 Main Street."
+        notice = SimpleNamespace(notice_id="n2", title=title, content=content, county=None)
+
+        event = adapter.adapt([notice])[0]
+
+        separate = adapter.extract_entities_from_text(title) + adapter.extract_entities_from_text(content)
+        ids = [e.entity_id for e in event.entities]
+        assert len(ids) == len(set(ids))
+        assert set(ids) == {e.entity_id for e in separate}
+        assert {"rezoning", "development", "environmental", "permit"} <= set(event.tags)
+
+    def test_raw_data_keeps_source_fields(self):
+        """Test notice raw_data is a plain dict that round-trips unchanged."""
+        import json
+        from types import SimpleNamespace
+
+        adapter = FloridaNoticesAdapter()
+        notice = SimpleNamespace(notice_id="n3", title="Notice", keywords="wetland rezoning")
+
+        event = adapter.adapt([notice])[0]
+        data = json.loads(json.dumps(event.to_dict()))
+
+        assert event.raw_data["notice_id"] == "n3"
+        assert data["raw_data"]["keywords"] == "wetland rezoning"
+        assert CivicEvent.from_dict(data).raw_data == event.raw_data
+
+    def test_blank_text_skips_extraction(self):
+        """Test blank text short-circuits, while generated titles are still scanned."""
+        from types import SimpleNamespace
+
+        adapter = FloridaNoticesAdapter()
+
+        assert adapter.extract_entities_from_text(" \n\t") == []
+        assert adapter.extract_tags_from_text("   ") == []
+
+        notice = SimpleNamespace(notice_id="n4", category="Smith Development", content="  ")
+        event = adapter.adapt([notice])[0]
+
+        assert event.title == "Public Notice - Smith Development"
+        assert "public-hearing" in event.tags
+        assert [e.name for e in event.entities] == ["Smith Development"]
+
+    def test_dict_path_matches_object_path(self):
+        """Test dict input shares _convert_notice and keeps the dict as raw_data."""
+        from types import SimpleNamespace
+
+        adapter = FloridaNoticesAdapter()
+        notice_dict = {
+            "id": "789",
+            "title": "Rezoning hearing",
+            "county": "Alachua",
+            "category": "Zoning",
+            "newspaper": "Gainesville Sun",
+            "publication_date": "2026-02-01",
+        }
+
+        from_dict = adapter.adapt_from_dict([notice_dict])[0]
+        from_obj = adapter.adapt([SimpleNamespace(**notice_dict, notice_id="789")])[0]
+
+        assert from_dict.event_id == from_obj.event_id == "florida-notice-789"
+        assert from_dict.tags == from_obj.tags
+        assert "alachua-county" in from_dict.tags
+        assert from_dict.description == from_obj.description
+        assert from_dict.raw_data is notice_dict
+
+    def test_parse_date_formats(self):
+        """Test each supported notice date format."""
+        adapter = FloridaNoticesAdapter()
+
+        for text in ("2026-01-15", "01/15/2026", "1/15/2026", "January 15, 2026", "Jan 15, 2026"):
+            assert adapter._parse_date(text) == datetime(2026, 1, 15), text
+
+        before = datetime.now()
+        assert adapter._parse_date("13/45/2026") >= before
+
     def test_adapt_notice_dict(self):
         """Test adapting notice dictionary."""
         adapter = FloridaNoticesAdapter()
@@ -543,6 +819,132 @@ class TestEventStore:
         assert len(store2) == 1
         assert store2.get_event("persist-test") is not None
 
+    def test_get_by_entity_substring_index(self, tmp_path):
+        """Test entity lookups match substrings of any length and track deletes."""
+        store = EventStore(tmp_path / "events.json", enable_supabase=False)
+        names = ["Acme Development LLC", "Smith Realty", "Acme Builders"]
+        for i, name in enumerate(names):
+            store.save_event(CivicEvent(
+                event_id=f"e{i}", event_type=EventType.PUBLIC_NOTICE, source_id="test",
+                timestamp=datetime(2026, 3, 1 + i), title=name,
+                entities=[Entity(entity_id=f"org-{i}", entity_type=EntityType.ORGANIZATION, name=name)],
+            ))
+
+        def ids(query):
+            return sorted(e.event_id for e in store.get_by_entity(query))
+
+        assert ids("ACME") == ["e0", "e2"]
+        assert ids("cme dev") == ["e0"]
+        assert ids("ty") == ["e1"]
+        assert ids("acme realty") == []
+
+        store.delete_event("e0")
+        assert ids("development") == []
+        assert not any("acme development llc" in names for names in store._name_grams.values())
+
+    def test_concurrent_saves_and_queries(self, tmp_path):
+        """Test writers and readers can share a store across threads."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        store = EventStore(tmp_path / "events.json", enable_supabase=False)
+
+        def write(n):
+            for i in range(50):
+                store.save_event(CivicEvent(
+                    event_id=f"w{n}-{i}", event_type=EventType.MEETING, source_id=f"s{n}",
+                    timestamp=datetime(2026, 3, 1) + timedelta(minutes=i), title=f"T {i}",
+                    tags=["permit"],
+                ))
+
+        def read(_):
+            for _ in range(50):
+                store.get_events(tags=["permit"], limit=10)
+                store.count_events(source_id="s0")
+                store.get_all_tags()
+
+        with ThreadPoolExecutor(max_workers=6) as pool:
+            futures = [pool.submit(fn, n) for n in range(3) for fn in (write, read)]
+            for future in futures:
+                future.result()
+
+        assert len(store) == 150
+        assert store.count_events(source_id="s1") == 50
+        assert len(store._by_timestamp) == 150
+        store.close()
+
+    def test_change_log_replay_and_compaction(self, tmp_path):
+        """Test saves append to the log, replay over the snapshot, and compact."""
+        import src.intelligence.event_store as event_store_module
+
+        path = tmp_path / "events.json"
+        store = EventStore(path, enable_supabase=False)
+
+        def event(i, title="Event"):
+            return CivicEvent(
+                event_id=f"e{i}", event_type=EventType.MEETING,
+                source_id="test", timestamp=datetime(2026, 3, 1), title=f"{title} {i}",
+            )
+
+        store.save_events([event(i) for i in range(3)])
+        store.save_event(event(1, title="Changed"))
+        store.delete_event("e0")
+
+        assert not path.exists()
+        assert len(store.log_path.read_text().splitlines()) == 5
+
+        # A torn trailing line (crash mid-append) is skipped on replay
+        with open(store.log_path, "a") as f:
+            f.write('{"op": "put", "ev')
+        reloaded = EventStore(path, enable_supabase=False)
+        assert sorted(e.event_id for e in reloaded.get_events()) == ["e1", "e2"]
+        assert reloaded.get_event("e1").title == "Changed 1"
+        reloaded.save_event(event(3))
+        reloaded.close()
+        assert EventStore(path, enable_supabase=False).get_event("e3") is not None
+
+        store.compact()
+        assert path.exists() and not store.log_path.exists()
+        assert len(EventStore(path, enable_supabase=False)) == 2
+
+        # Log growth past the live-set ratio triggers compaction
+        small = EventStore(tmp_path / "small.json", enable_supabase=False)
+        for i in range(event_store_module.COMPACT_MIN_LOG_ENTRIES + 1):
+            small.save_event(event(0, title=f"v{i}"))
+        assert small.storage_path.exists()
+        assert small._log_entries < event_store_module.COMPACT_MIN_LOG_ENTRIES
+        store.close()
+        small.close()
+
+    def test_save_events_batches_log_and_supabase(self, tmp_path):
+        """Test save_events writes one log batch and one upsert per chunk."""
+        from unittest.mock import MagicMock
+
+        store = EventStore(tmp_path / "events.json", enable_supabase=False)
+        store._supabase = MagicMock()
+        store._supabase_available = True
+
+        events = [
+            CivicEvent(
+                event_id=f"e{i}", event_type=EventType.MEETING,
+                source_id="test", timestamp=datetime(2026, 3, 1), title=f"Event {i}",
+            )
+            for i in range(4)
+        ]
+        store.save_events(events[:2])
+        counts = store.save_events(events)
+
+        assert counts == {"new": 2, "updated": 0, "unchanged": 2}
+        assert len(store.log_path.read_text().splitlines()) == 4
+        upserts = store._supabase.table.return_value.upsert.call_args_list
+        assert [len(call.args[0]) for call in upserts] == [2, 2]
+        assert upserts[1].args[0][0]["event_id"] == "e2"
+
+        # Unchanged batches touch neither the log nor Supabase
+        store.save_events(events)
+        assert len(upserts) == 2
+        store.close()
+        assert len(EventStore(tmp_path / "events.json", enable_supabase=False)) == 4
+
     def test_get_sources(self, tmp_path):
         """Test getting unique sources."""
         store = EventStore(tmp_path / "events.json")
@@ -560,6 +962,56 @@ class TestEventStore:
         assert "civicclerk" in sources
         assert "srwmd" in sources
 
+    def test_indexed_queries_match_scan(self, tmp_path):
+        """Test index-backed queries agree with a full scan, across updates and deletes."""
+        store = EventStore(tmp_path / "events.json", enable_supabase=False)
+        base = datetime(2026, 3, 1, 9, 0)
+
+        for i in range(12):
+            store.save_event(CivicEvent(
+                event_id=f"e{i}",
+                event_type=EventType.MEETING if i % 2 else EventType.PUBLIC_NOTICE,
+                source_id="civicclerk" if i % 3 else "srwmd",
+                timestamp=base + timedelta(days=i),
+                title=f"Event {i}",
+                location=GeoLocation(latitude=0.0, longitude=0.0, county="Alachua") if i % 4 == 0 else None,
+                entities=[Entity(entity_id=f"org-{i % 3}", entity_type=EntityType.ORGANIZATION, name=f"Acme {i % 3} LLC")],
+                tags=["permit", "alachua"] if i % 2 else ["permit"],
+            ))
+
+        store.save_event(CivicEvent(
+            event_id="e1", event_type=EventType.MEETING, source_id="srwmd",
+            timestamp=base - timedelta(days=1), title="Moved", tags=["water"],
+        ))
+        store.delete_event("e2")
+
+        events = list(store._events.values())
+
+        def scan(pred):
+            return sorted((e.event_id for e in events if pred(e)))
+
+        def ids(results):
+            return sorted(e.event_id for e in results)
+
+        result = store.get_events(source_id="civicclerk", tags=["PERMIT", "alachua"], since=base + timedelta(days=2))
+        assert ids(result) == scan(
+            lambda e: e.source_id == "civicclerk" and e.matches_tags(["permit", "alachua"]) and e.timestamp >= base + timedelta(days=2)
+        )
+        assert [e.timestamp for e in result] == sorted((e.timestamp for e in result), reverse=True)
+        assert len(store.get_events(event_type=EventType.MEETING, limit=2)) == 2
+        assert store.get_events(until=base)[0].event_id == "e0"
+        assert ids(store.get_by_entity("acme 1")) == scan(lambda e: any("acme 1" in n.normalized_name for n in e.entities))
+        assert ids(store.get_by_county("Alachua")) == scan(
+            lambda e: (e.location and e.location.county == "Alachua") or "alachua" in e.tags
+        )
+        assert store.count_events(source_id="srwmd") == len(scan(lambda e: e.source_id == "srwmd"))
+        assert store.count_events() == len(store) == 11
+        assert "water" in store.get_all_tags()
+        assert store.get_events(tags=["nonexistent"]) == []
+
+        store.clear()
+        assert store.get_sources() == [] and store.get_events() == []
+
 
 class TestRulesEngine:
     """Tests for RulesEngine."""
@@ -782,6 +1234,7 @@ class TestAlertModel:
 
         assert alert.severity == AlertSeverity.NOTABLE
         assert not alert.acknowledged
+        assert not hasattr(alert, "__dict__")
 
     def test_acknowledge_alert(self):
         """Test acknowledging an alert."""
@@ -806,3 +1259,23 @@ class TestAlertModel:
         assert alert.acknowledged
         assert alert.acknowledged_by == "user@example.com"
         assert alert.acknowledged_at is not None
+
+
+class TestSerialization:
+    """Tests for state-file JSON encoding."""
+
+    def test_round_trip_with_and_without_orjson(self, monkeypatch):
+        """Test orjson and stdlib paths decode to the same data."""
+        import src.intelligence.serialization as serialization
+
+        data = {"title": "Café hearing", "when": datetime(2026, 3, 1, 9, 30), "tags": ["a", "b"]}
+        encoded = serialization.dumps(data, indent=True)
+
+        assert isinstance(encoded, bytes)
+        assert serialization.loads(encoded)["title"] == "Café hearing"
+
+        monkeypatch.setattr(serialization, "_orjson", lambda: None)
+        fallback = serialization.dumps(data)
+
+        assert serialization.loads(fallback) == serialization.loads(encoded)
+        assert serialization.loads(fallback.decode())["when"] == "2026-03-01T09:30:00"